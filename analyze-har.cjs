@@ -95,15 +95,16 @@ if (timings.length > 0) {
   for (const window of windows) {
     let maxInWindow = 0;
 
+    // timings is sorted, so slide the window end forward instead of
+    // re-filtering the whole list for every start position
+    let end = 0;
     for (let i = 0; i < timings.length; i++) {
-      const windowStart = timings[i].timestamp;
-      const windowEnd = windowStart + window.ms;
-
-      const count = timings.filter(t =>
-        t.timestamp >= windowStart && t.timestamp < windowEnd
-      ).length;
+      const windowEnd = timings[i].timestamp + window.ms;
+      while (end < timings.length && timings[end].timestamp < windowEnd) {
+        end++;
+      }
 
-      maxInWindow = Math.max(maxInWindow, count);
+      maxInWindow = Math.max(maxInWindow, end - i);
     }
 
     console.log(`  Max in ${window.label}: ${maxInWindow} requests`);
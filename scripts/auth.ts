@@ -5,8 +5,8 @@
  * Claude Desktop will use those tokens automatically on next start.
  */
 import { createServer } from 'http';
-import { randomBytes, createHash } from 'crypto';
-import { exec } from 'child_process';
+import { randomBytes, createHash, createCipheriv } from 'crypto';
+import { spawn } from 'child_process';
 import { promises as fs } from 'fs';
 import path from 'path';
 import dotenv from 'dotenv';
@@ -31,9 +31,16 @@ if (!CLIENT_ID || !CLIENT_SECRET) {
   process.exit(1);
 }
 
-// PKCE
+// Decode the storage key up front so a bad key fails before the browser flow
+const ENCRYPTION_KEY_BYTES = Buffer.from(ENCRYPTION_KEY, 'base64');
+if (ENCRYPTION_KEY_BYTES.length !== 32) {
+  console.error('❌  ENCRYPTION_KEY must be a base64-encoded 32-byte key (openssl rand -base64 32)');
+  process.exit(1);
+}
+
+// PKCE (RFC 7636 S256): Node encodes straight to base64url, no padding to strip
 const codeVerifier = randomBytes(32).toString('base64url');
-const codeChallenge = createHash('sha256').update(codeVerifier).digest('base64url');
+const codeChallenge = createHash('sha256').update(codeVerifier, 'ascii').digest('base64url');
 
 // Build authorization URL
 const authUrl = new URL('https://accounts.google.com/o/oauth2/v2/auth');
@@ -47,12 +54,9 @@ authUrl.searchParams.set('access_type', 'offline');
 authUrl.searchParams.set('prompt', 'consent');
 
 // Encrypt tokens for storage (AES-256-GCM, same as token-store.ts)
-import { createCipheriv, randomBytes as rb } from 'crypto';
-
 function encryptTokens(data: object): string {
-  const key = Buffer.from(ENCRYPTION_KEY, 'base64');
-  const iv = rb(16);
-  const cipher = createCipheriv('aes-256-gcm', key, iv);
+  const iv = randomBytes(16);
+  const cipher = createCipheriv('aes-256-gcm', ENCRYPTION_KEY_BYTES, iv);
   const json = JSON.stringify(data);
   let encrypted = cipher.update(json, 'utf8', 'hex');
   encrypted += cipher.final('hex');
@@ -141,5 +145,22 @@ server.listen(CALLBACK_PORT, () => {
   console.log('Opening browser for Google authentication...');
   console.log('(If it does not open automatically, copy this URL:)');
   console.log(`\n  ${authUrl.toString()}\n`);
-  exec(`open "${authUrl.toString()}"`);
+  openBrowser(authUrl.toString());
 });
+
+/**
+ * Open a URL in the default browser without going through a shell,
+ * so the URL never needs escaping
+ */
+function openBrowser(url: string): void {
+  const [command, args]: [string, string[]] =
+    process.platform === 'darwin' ? ['open', [url]] :
+    process.platform === 'win32' ? ['rundll32', ['url.dll,FileProtocolHandler', url]] :
+    ['xdg-open', [url]];
+
+  const child = spawn(command, args, { stdio: 'ignore', detached: true });
+  child.on('error', () => {
+    // Browser couldn't be launched; the URL is printed above for manual use
+  });
+  child.unref();
+}
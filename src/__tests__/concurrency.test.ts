@@ -0,0 +1,38 @@
+/**
+ * Unit tests for the bounded-concurrency map helper
+ */
+
+import { describe, it, expect } from '@jest/globals';
+import { mapWithConcurrency } from '../utils/concurrency.js';
+
+const delay = (ms: number) => new Promise((resolve) => setTimeout(resolve, ms));
+
+describe('mapWithConcurrency', () => {
+  it('should preserve input order in results', async () => {
+    const results = await mapWithConcurrency([30, 10, 20], 3, async (ms, index) => {
+      await delay(ms);
+      return index;
+    });
+
+    expect(results).toEqual([0, 1, 2]);
+  });
+
+  it('should never exceed the concurrency limit', async () => {
+    let inFlight = 0;
+    let maxInFlight = 0;
+
+    await mapWithConcurrency(Array.from({ length: 10 }, (_, i) => i), 3, async () => {
+      inFlight++;
+      maxInFlight = Math.max(maxInFlight, inFlight);
+      await delay(5);
+      inFlight--;
+    });
+
+    expect(maxInFlight).toBe(3);
+  });
+
+  it('should handle an empty input', async () => {
+    const results = await mapWithConcurrency([], 4, async () => 1);
+    expect(results).toEqual([]);
+  });
+});
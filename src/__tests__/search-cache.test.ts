@@ -0,0 +1,99 @@
+/* eslint-disable @typescript-eslint/no-explicit-any */
+/**
+ * Unit tests for the YouTube Music search cache
+ *
+ * fetchSearch is stubbed so these tests exercise only the caching layer:
+ * repeat hits, in-flight coalescing, per-user scoping, and the shorter TTL
+ * for empty results.
+ */
+
+import { describe, it, expect, beforeAll, beforeEach, afterAll, jest } from '@jest/globals';
+import { tmpdir } from 'os';
+import { join } from 'path';
+import type { SearchResponse } from '../types/index.js';
+
+// Config is validated on import, so set up the environment first
+process.env['BYPASS_AUTH_FOR_TESTING'] = 'true';
+process.env['TOKEN_STORAGE_PATH'] = join(tmpdir(), `ytm-mcp-search-cache-${process.pid}-${Date.now()}`, 'tokens.json');
+
+const searchResult = (returned: number): SearchResponse => ({
+  songs: [],
+  metadata: { returned, hasMore: false },
+});
+
+describe('YouTubeMusicClient search cache', () => {
+  let YouTubeMusicClient: typeof import('../youtube-music/client.js').YouTubeMusicClient;
+  let tokenStore: typeof import('../auth/token-store.js').tokenStore;
+  let client: InstanceType<typeof YouTubeMusicClient>;
+  let fetchSearch: jest.Mock<(...args: unknown[]) => Promise<SearchResponse>>;
+
+  beforeAll(async () => {
+    ({ YouTubeMusicClient } = await import('../youtube-music/client.js'));
+    ({ tokenStore } = await import('../auth/token-store.js'));
+    const expiresAt = Date.now() + 3600000;
+    tokenStore.setToken('session-a', { accessToken: 'token-a', refreshToken: '', expiresAt });
+    tokenStore.setToken('session-b', { accessToken: 'token-b', refreshToken: '', expiresAt });
+  });
+
+  beforeEach(() => {
+    client = new YouTubeMusicClient();
+    fetchSearch = jest.fn(async () => searchResult(1));
+    (client as any).fetchSearch = fetchSearch;
+  });
+
+  afterAll(async () => {
+    await tokenStore.flush();
+  });
+
+  it('should serve a repeated search from the cache', async () => {
+    const first = await client.search('daft punk', { filter: 'songs', limit: 5 });
+    const second = await client.search('daft punk', { filter: 'songs', limit: 5 });
+
+    expect(second).toBe(first);
+    expect(fetchSearch).toHaveBeenCalledTimes(1);
+  });
+
+  it('should not share cached results between users', async () => {
+    const first = await tokenStore.runWithSession('session-a', () => client.search('daft punk'));
+    const second = await tokenStore.runWithSession('session-b', () => client.search('daft punk'));
+    const again = await tokenStore.runWithSession('session-a', () => client.search('daft punk'));
+
+    expect(second).not.toBe(first);
+    expect(again).toBe(first);
+    expect(fetchSearch).toHaveBeenCalledTimes(2);
+  });
+
+  it('should coalesce concurrent identical searches from one user', async () => {
+    const [first, second] = await tokenStore.runWithSession('session-a', () =>
+      Promise.all([client.search('daft punk'), client.search('daft punk')])
+    );
+
+    expect(second).toBe(first);
+    expect(fetchSearch).toHaveBeenCalledTimes(1);
+  });
+
+  it('should not coalesce concurrent searches from different users', async () => {
+    const [first, second] = await Promise.all([
+      tokenStore.runWithSession('session-a', () => client.search('daft punk')),
+      tokenStore.runWithSession('session-b', () => client.search('daft punk')),
+    ]);
+
+    expect(second).not.toBe(first);
+    expect(fetchSearch).toHaveBeenCalledTimes(2);
+  });
+
+  it('should expire empty results after 60 seconds', async () => {
+    fetchSearch.mockImplementationOnce(async () => searchResult(0));
+    await client.search('nothing here');
+    await client.search('daft punk');
+
+    const cache = (client as any).searchCache;
+    const keys = [...cache.keys()] as string[];
+    const ttlFor = (query: string): number =>
+      cache.getRemainingTTL(keys.find((key) => key.endsWith(`|${query}`)));
+
+    expect(ttlFor('nothing here')).toBeGreaterThan(0);
+    expect(ttlFor('nothing here')).toBeLessThanOrEqual(60 * 1000);
+    expect(ttlFor('daft punk')).toBeGreaterThan(60 * 1000);
+  });
+});
@@ -0,0 +1,78 @@
+/**
+ * Tests for binding MCP sessions to HTTP requests
+ *
+ * The /mcp chain parses the JSON body before binding the session. These tests
+ * mount the same chain and check that concurrent sessions each see only their
+ * own token once the route handler runs.
+ */
+
+import { describe, it, expect, beforeAll, afterAll } from '@jest/globals';
+import { tmpdir } from 'os';
+import { join } from 'path';
+import type { AddressInfo } from 'net';
+import type { Server } from 'http';
+
+// Config is validated on import, so set up the environment first
+process.env['BYPASS_AUTH_FOR_TESTING'] = 'true';
+process.env['TOKEN_STORAGE_PATH'] = join(tmpdir(), `ytm-mcp-session-binding-${process.pid}-${Date.now()}`, 'tokens.json');
+
+const delay = (ms: number) => new Promise((resolve) => setTimeout(resolve, ms));
+
+describe('bindSessionToken', () => {
+  let server: Server;
+  let baseUrl: string;
+  let flushTokens: () => Promise<void>;
+
+  beforeAll(async () => {
+    const { default: express } = await import('express');
+    const { bindSessionToken } = await import('../auth/session-binding.js');
+    const { tokenStore } = await import('../auth/token-store.js');
+    flushTokens = () => tokenStore.flush();
+
+    // Same order as the /mcp chain in server.ts
+    const app = express();
+    app.use('/mcp', express.json());
+    app.use('/mcp', bindSessionToken);
+    app.post('/mcp', async (req, res) => {
+      // Hold the request open so the two sessions interleave
+      await delay((req.body as { wait: number }).wait);
+      res.json({
+        sessionId: tokenStore.getCurrentSessionId(),
+        token: tokenStore.getCurrentToken()?.accessToken ?? null,
+      });
+    });
+
+    await new Promise<void>((resolve) => {
+      server = app.listen(0, '127.0.0.1', () => resolve());
+    });
+    baseUrl = `http://127.0.0.1:${(server.address() as AddressInfo).port}`;
+  });
+
+  afterAll(async () => {
+    await new Promise((resolve) => server.close(resolve));
+    await flushTokens();
+  });
+
+  const callAs = async (sessionId: string, token: string, wait: number) => {
+    const response = await fetch(`${baseUrl}/mcp`, {
+      method: 'POST',
+      headers: {
+        'Content-Type': 'application/json',
+        Authorization: `Bearer ${token}`,
+        'mcp-session-id': sessionId,
+      },
+      body: JSON.stringify({ wait }),
+    });
+    return response.json() as Promise<{ sessionId: string | null; token: string | null }>;
+  };
+
+  it('should give each concurrent session only its own token', async () => {
+    const [first, second] = await Promise.all([
+      callAs('session-a', 'token-a', 30),
+      callAs('session-b', 'token-b', 5),
+    ]);
+
+    expect(first).toEqual({ sessionId: 'session-a', token: 'token-a' });
+    expect(second).toEqual({ sessionId: 'session-b', token: 'token-b' });
+  });
+});
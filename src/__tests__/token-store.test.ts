@@ -0,0 +1,59 @@
+/**
+ * Unit tests for per-request session binding in the token store
+ */
+
+import { describe, it, expect, beforeAll, afterAll } from '@jest/globals';
+import { tmpdir } from 'os';
+import { join } from 'path';
+
+// Config is validated on import, so set up the environment first
+process.env['BYPASS_AUTH_FOR_TESTING'] = 'true';
+process.env['TOKEN_STORAGE_PATH'] = join(tmpdir(), `ytm-mcp-token-store-${process.pid}-${Date.now()}`, 'tokens.json');
+
+const delay = (ms: number) => new Promise((resolve) => setTimeout(resolve, ms));
+
+describe('tokenStore.runWithSession', () => {
+  let tokenStore: typeof import('../auth/token-store.js').tokenStore;
+
+  beforeAll(async () => {
+    ({ tokenStore } = await import('../auth/token-store.js'));
+    const expiresAt = Date.now() + 3600000;
+    tokenStore.setToken('session-a', { accessToken: 'token-a', refreshToken: '', expiresAt });
+    tokenStore.setToken('session-b', { accessToken: 'token-b', refreshToken: '', expiresAt });
+  });
+
+  afterAll(async () => {
+    await tokenStore.flush();
+  });
+
+  it('should keep each session bound across interleaved awaits', async () => {
+    const seen: string[] = [];
+
+    const run = (sessionId: string, waits: number[]) =>
+      tokenStore.runWithSession(sessionId, async () => {
+        for (const ms of waits) {
+          await delay(ms);
+          seen.push(`${sessionId}:${tokenStore.getCurrentToken()?.accessToken}`);
+        }
+      });
+
+    await Promise.all([run('session-a', [20, 1, 20]), run('session-b', [1, 20, 1])]);
+
+    expect(seen).toHaveLength(6);
+    expect(seen.filter((entry) => entry.startsWith('session-a'))).toEqual(
+      Array(3).fill('session-a:token-a')
+    );
+    expect(seen.filter((entry) => entry.startsWith('session-b'))).toEqual(
+      Array(3).fill('session-b:token-b')
+    );
+  });
+
+  it('should not leak a session outside its run', async () => {
+    await tokenStore.runWithSession('session-a', async () => {
+      await delay(1);
+    });
+
+    expect(tokenStore.getCurrentSessionId()).toBeNull();
+    expect(tokenStore.getCurrentToken()).toBeUndefined();
+  });
+});
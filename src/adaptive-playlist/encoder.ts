@@ -232,18 +232,18 @@ export function calculateConfidence(profile: Partial<Profile>): number {
   return Math.min(35, score);
 }
 
+// Embedded profile markers: 🧬:1-XXXX... or PROFILE:1-XXXX...
+const PROFILE_CODE_PATTERNS = [
+  /🧬:([1-9A-Z]-[0-9A-ZX]{35})/,
+  /PROFILE:([1-9A-Z]-[0-9A-ZX]{35})/i,
+  /<!--\s*PROFILE:([1-9A-Z]-[0-9A-ZX]{35})\s*-->/,
+];
+
 /**
  * Extract profile code from playlist description
  */
 export function extractProfileCode(description: string): string | null {
-  // Look for embedded profile: 🧬:1-XXXX... or PROFILE:1-XXXX...
-  const patterns = [
-    /🧬:([1-9A-Z]-[0-9A-ZX]{35})/,
-    /PROFILE:([1-9A-Z]-[0-9A-ZX]{35})/i,
-    /<!--\s*PROFILE:([1-9A-Z]-[0-9A-ZX]{35})\s*-->/,
-  ];
-
-  for (const pattern of patterns) {
+  for (const pattern of PROFILE_CODE_PATTERNS) {
     const match = description.match(pattern);
     if (match && match[1]) {
       return match[1];
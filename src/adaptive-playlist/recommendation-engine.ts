@@ -66,9 +66,10 @@ export class RecommendationEngine {
     const userId = profile.userId || 'default_user';
     const enrichedTracks = await this.enrichWithUserData(tracksWithFeatures, userId);
 
-    // Step 4: Score each track
+    // Step 4: Score each track against a single clock reading
+    const now = Date.now();
     const scoredTracks = enrichedTracks.map((track) => {
-      const scoring = calculateFinalScore(track, profile, context);
+      const scoring = calculateFinalScore(track, profile, context, now);
 
       return {
         track,
@@ -374,9 +375,21 @@ export class RecommendationEngine {
   ): Promise<Track[]> {
     const tracks: Track[] = [];
 
+    // One query for every candidate already in the feature cache instead of
+    // a lookup per candidate; only the misses go on to full extraction
+    const cached = await this.featureExtractor.getCachedFeaturesMany(
+      candidates.map((candidate) => candidate.videoId)
+    );
+
     for (const candidate of candidates) {
+      const cachedFeatures = cached.get(candidate.videoId);
+      if (cachedFeatures) {
+        tracks.push(cachedFeatures);
+        continue;
+      }
+
       try {
-        const features = await this.featureExtractor.extractFeatures(
+        const features = await this.featureExtractor.extractFreshFeatures(
           candidate.videoId,
           candidate.title,
           candidate.artist,
@@ -385,6 +398,8 @@ export class RecommendationEngine {
 
         if (features) {
           tracks.push(features);
+          // A repeated candidate reuses this instead of extracting again
+          cached.set(candidate.videoId, features);
         }
       } catch (error) {
         logger.debug('Feature extraction failed for track', {
@@ -402,31 +417,36 @@ export class RecommendationEngine {
    */
   private async enrichWithUserData(tracks: Track[], userId: string): Promise<Track[]> {
     try {
-      // Get user's listening history
-      const historyResult = await this.db.query(
-        'SELECT video_id, play_count, last_played_at FROM user_listening_history WHERE user_id = $1',
-        [userId]
-      );
-
-      const historyMap = new Map<string, { playCount: number; lastPlayed: Date }>();
+      // The history and artist-familiarity queries are independent, so run
+      // them concurrently on separate pool connections
+      const [historyResult, artistsResult] = await Promise.all([
+        // Get user's listening history
+        this.db.query(
+          'SELECT video_id, play_count, last_played_at FROM user_listening_history WHERE user_id = $1',
+          [userId]
+        ),
+        // Get user's artist familiarity
+        this.db.query(
+          `SELECT artist, SUM(play_count) as total_plays
+           FROM user_listening_history h
+           JOIN song_features f ON h.video_id = f.video_id
+           WHERE h.user_id = $1
+           GROUP BY artist`,
+          [userId]
+        ),
+      ]);
+
+      // Keep last-played times as epoch ms: pg already returns TIMESTAMP
+      // columns as Date objects, so there's no need to copy each one
+      const historyMap = new Map<string, { playCount: number; lastPlayedAt: number | undefined }>();
       for (const row of historyResult.rows) {
-        const r = row as { video_id: string; play_count: number; last_played_at: Date };
+        const r = row as { video_id: string; play_count: number; last_played_at: Date | null };
         historyMap.set(r.video_id, {
           playCount: r.play_count,
-          lastPlayed: new Date(r.last_played_at),
+          lastPlayedAt: r.last_played_at?.getTime(),
         });
       }
 
-      // Get user's artist familiarity
-      const artistsResult = await this.db.query(
-        `SELECT artist, SUM(play_count) as total_plays
-         FROM user_listening_history h
-         JOIN song_features f ON h.video_id = f.video_id
-         WHERE h.user_id = $1
-         GROUP BY artist`,
-        [userId]
-      );
-
       const artistFamiliarityMap = new Map<string, number>();
       const maxPlays =
         artistsResult.rows.length > 0
@@ -446,7 +466,7 @@ export class RecommendationEngine {
         return {
           ...track,
           userPlayCount: history?.playCount || 0,
-          lastPlayedDate: history?.lastPlayed,
+          lastPlayedAt: history?.lastPlayedAt,
           artistFamiliarity,
           isNewArtist: artistFamiliarity === 0,
         };
@@ -588,10 +608,13 @@ export class RecommendationEngine {
     const finalResult = result.filter((r): r is RecommendationResult => r !== null);
     this.smoothTransitions(finalResult);
 
-    logger.debug('Reordered playlist for variety and flow', {
-      originalOrder: recommendations.slice(0, 5).map(r => r.track.artist),
-      newOrder: finalResult.slice(0, 5).map(r => r.track.artist),
-    });
+    // Only build the artist previews when debug logging is on
+    if (logger.isDebugEnabled()) {
+      logger.debug('Reordered playlist for variety and flow', {
+        originalOrder: recommendations.slice(0, 5).map(r => r.track.artist),
+        newOrder: finalResult.slice(0, 5).map(r => r.track.artist),
+      });
+    }
 
     return finalResult;
   }
@@ -7,17 +7,19 @@ import { calculateTertiaryScore } from './tertiary.js';
  * Calculate final recommendation score for a track
  * Combines primary (70%) + secondary (20%) + tertiary (10%) tiers
  * Applies contextual modulation and exploration factor
+ * `now` (epoch ms) lets a batch of tracks be scored against one clock reading
  */
 export function calculateFinalScore(
   track: Track,
   profile: Profile,
-  context: Context
+  context: Context,
+  now: number = Date.now()
 ): ScoringResult {
   // PRIMARY TIER (70%)
-  const primaryScore = calculatePrimaryScore(track, profile, context);
+  const primaryScore = calculatePrimaryScore(track, profile, context, now);
 
   // SECONDARY TIER (20%)
-  const secondaryScore = calculateSecondaryScore(track, profile, context);
+  const secondaryScore = calculateSecondaryScore(track, profile, context, now);
 
   // TERTIARY TIER (10%)
   const tertiaryScore = calculateTertiaryScore(track, profile);
@@ -26,7 +28,7 @@ export function calculateFinalScore(
   const baseScore = primaryScore + secondaryScore + tertiaryScore;
 
   // CONTEXTUAL MODULATION
-  const modulation = applyContextualModulation(baseScore, track, context, profile);
+  const modulation = applyContextualModulation(baseScore, track, context, profile, now);
   const modulatedScore = baseScore * modulation;
 
   // EXPLORATION FACTOR
@@ -55,7 +57,8 @@ function applyContextualModulation(
   baseScore: number,
   track: Track,
   context: Context,
-  profile: Profile
+  profile: Profile,
+  now: number
 ): number {
   let modulation = 1.0;
 
@@ -113,7 +116,7 @@ function applyContextualModulation(
   }
 
   // Age-based social influence
-  const age = calculateAge(profile.age.birthDecade);
+  const age = calculateAge(profile.age.birthDecade, now);
   if (age < 25 && context.socialFunction > 10) {
     if (track.isTrending) {
       modulation *= 1.4;
@@ -58,8 +58,13 @@ const ACTIVITY_PROFILES: Record<number, ActivityProfile> = {
 /**
  * Calculate primary tier score (70% weight)
  */
-export function calculatePrimaryScore(track: Track, profile: Profile, context: Context): number {
-  const familiarity = calculateFamiliarityMatch(track, profile) * 0.3;
+export function calculatePrimaryScore(
+  track: Track,
+  profile: Profile,
+  context: Context,
+  now: number = Date.now()
+): number {
+  const familiarity = calculateFamiliarityMatch(track, profile, now) * 0.3;
   const musicalFeatures = calculateMusicalFeaturesMatch(track, profile) * 0.25;
   const contextFit = calculateContextFit(track, context) * 0.15;
 
@@ -69,10 +74,14 @@ export function calculatePrimaryScore(track: Track, profile: Profile, context: C
 /**
  * 1. Familiarity Match (30% of total)
  */
-export function calculateFamiliarityMatch(track: Track, profile: Profile): number {
+export function calculateFamiliarityMatch(
+  track: Track,
+  profile: Profile,
+  now: number = Date.now()
+): number {
   const styleFamiliarity = calculateStyleFamiliarity(track, profile) * 0.7;
   const trackExposure = calculateTrackExposureScore(track, profile) * 0.2;
-  const recency = calculateOptimalRecency(track, profile) * 0.1;
+  const recency = calculateOptimalRecency(track, now) * 0.1;
 
   return normalize(styleFamiliarity + trackExposure + recency);
 }
@@ -155,12 +164,12 @@ function calculateTrackExposureScore(track: Track, _profile: Profile): number {
   }
 }
 
-function calculateOptimalRecency(track: Track, _profile: Profile): number {
-  if (!track.lastPlayedDate) {
+function calculateOptimalRecency(track: Track, now: number): number {
+  if (track.lastPlayedAt === undefined) {
     return 1.0; // No penalty for never played
   }
 
-  const daysSinceLast = daysBetween(track.lastPlayedDate, new Date());
+  const daysSinceLast = daysBetween(track.lastPlayedAt, now);
 
   if (daysSinceLast < 0.125) {
     // <3 hours
@@ -361,7 +370,7 @@ function normalize(value: number, min: number = 0, max: number = 1): number {
   return Math.max(min, Math.min(max, value));
 }
 
-function daysBetween(date1: Date, date2: Date): number {
+function daysBetween(time1: number, time2: number): number {
   const msPerDay = 1000 * 60 * 60 * 24;
-  return Math.abs((date2.getTime() - date1.getTime()) / msPerDay);
+  return Math.abs((time2 - time1) / msPerDay);
 }
@@ -8,9 +8,14 @@ import type { Track, Profile, Context } from '../types.js';
 /**
  * Calculate secondary tier score (20% weight)
  */
-export function calculateSecondaryScore(track: Track, profile: Profile, context: Context): number {
+export function calculateSecondaryScore(
+  track: Track,
+  profile: Profile,
+  context: Context,
+  now: number = Date.now()
+): number {
   const mood = calculateMoodMatch(track, context, profile) * 0.08;
-  const age = calculateAgeAppropriateness(track, profile) * 0.05;
+  const age = calculateAgeAppropriateness(track, profile, now) * 0.05;
   const discovery = calculateDiscoveryAdjustedNovelty(track, profile) * 0.04;
   const sophistication = calculateSophisticationMatch(track, profile) * 0.03;
 
@@ -72,18 +77,22 @@ function calculateRegulationGoalFit(
 /**
  * 5. Age Appropriateness (5% of total)
  */
-export function calculateAgeAppropriateness(track: Track, profile: Profile): number {
-  const currentAgeFit = calculateCurrentAgeFit(track, profile) * 0.4;
+export function calculateAgeAppropriateness(
+  track: Track,
+  profile: Profile,
+  now: number = Date.now()
+): number {
+  const currentAgeFit = calculateCurrentAgeFit(track, profile, now) * 0.4;
   const reminiscenceBump = calculateReminiscenceBumpMatch(track, profile) * 0.6;
 
   return normalize(currentAgeFit + reminiscenceBump);
 }
 
-function calculateCurrentAgeFit(track: Track, profile: Profile): number {
+function calculateCurrentAgeFit(track: Track, profile: Profile, now: number): number {
   const birthDecade = profile.age.birthDecade;
   if (birthDecade < 0) return 0.7; // Unknown age, neutral score
 
-  const age = calculateAge(birthDecade);
+  const age = calculateAge(birthDecade, now);
 
   // Age-based dimension preferences
   let dimensionScore = 0.7; // Default
@@ -132,9 +141,9 @@ function calculateReminiscenceBumpMatch(track: Track, profile: Profile): number
   }
 }
 
-export function calculateAge(birthDecade: number): number {
+export function calculateAge(birthDecade: number, now: number = Date.now()): number {
   // birthDecade: 0=<1960, 5=1980s, A(10)=2000s, F(15)=2010s
-  const currentYear = new Date().getFullYear();
+  const currentYear = new Date(now).getFullYear();
   const birthYear =
     birthDecade < 10 ? 1960 + birthDecade * 10 : 2000 + (birthDecade - 10) * 10;
   return currentYear - birthYear;
@@ -1,16 +1,21 @@
 import type { ConversationSession, Profile, Database } from './types.js';
 import { calculateConfidence } from './encoder.js';
 import { createLogger } from '../utils/logger.js';
-import { randomBytes } from 'crypto';
+import { randomUUID } from 'crypto';
+import { LRUCache } from 'lru-cache';
 
 const logger = createLogger('session-manager');
 
+// Sessions live in the database; the in-memory copy is just a hot cache,
+// so bound it and let entries age out with their session
+const MAX_CACHED_SESSIONS = 500;
+
 /**
  * Manages conversation sessions for adaptive playlist building
  */
 export class SessionManager {
-  // In-memory cache of active sessions
-  private sessionCache = new Map<string, ConversationSession>();
+  // In-memory cache of active sessions, each entry expiring with its session
+  private sessionCache = new LRUCache<string, ConversationSession>({ max: MAX_CACHED_SESSIONS });
 
   constructor(private db: Database) { }
 
@@ -51,16 +56,16 @@ export class SessionManager {
 
     // Save to database
     try {
-      // Ensure user profile exists (create if needed)
-      await this.db.query(
-        `INSERT INTO user_profiles (user_id, created_at)
-         VALUES ($1, CURRENT_TIMESTAMP)
-         ON CONFLICT (user_id) DO NOTHING`,
-        [userId]
-      );
-
+      // Ensure user profile exists (create if needed) in the same statement
+      // as the session insert: one round-trip instead of two, and the
+      // foreign key check at end of statement sees the new profile row
       await this.db.query(
-        `INSERT INTO conversation_sessions (
+        `WITH ensured_profile AS (
+          INSERT INTO user_profiles (user_id, created_at)
+          VALUES ($2, CURRENT_TIMESTAMP)
+          ON CONFLICT (user_id) DO NOTHING
+        )
+        INSERT INTO conversation_sessions (
           session_id, user_id, profile_partial, conversation_history,
           questions_asked, confidence, created_at, expires_at
         ) VALUES ($1, $2, $3, $4, $5, $6, to_timestamp($7/1000.0), to_timestamp($8/1000.0))`,
@@ -77,7 +82,7 @@ export class SessionManager {
       );
 
       // Cache in memory
-      this.sessionCache.set(sessionId, session);
+      this.cacheSession(session);
 
       logger.info('Session created', { sessionId, userId });
 
@@ -92,20 +97,21 @@ export class SessionManager {
    * Get an existing session
    */
   async getSession(sessionId: string): Promise<ConversationSession | null> {
-    // Check cache first
-    if (this.sessionCache.has(sessionId)) {
-      const cached = this.sessionCache.get(sessionId);
-      if (cached && cached.expiresAt > Date.now()) {
-        return cached;
-      }
-      // Expired, remove from cache
-      this.sessionCache.delete(sessionId);
+    // Check cache first (expired entries are never returned)
+    const cached = this.sessionCache.get(sessionId);
+    if (cached) {
+      return cached;
     }
 
     // Load from database
     try {
+      // Expired rows are filtered out here (same test as the cleanup
+      // function) so their history is never shipped over or parsed
       const result = await this.db.query(
-        `SELECT * FROM conversation_sessions WHERE session_id = $1`,
+        `SELECT session_id, user_id, profile_partial, conversation_history,
+                questions_asked, confidence, ai_notes, created_at, expires_at, completed
+         FROM conversation_sessions
+         WHERE session_id = $1 AND expires_at >= NOW()`,
         [sessionId]
       );
 
@@ -116,8 +122,9 @@ export class SessionManager {
       const row = result.rows[0] as {
         session_id: string;
         user_id: string;
-        profile_partial: string;
-        conversation_history: string;
+        // JSONB columns: node-postgres hands these back already parsed
+        profile_partial: Partial<Profile>;
+        conversation_history: ConversationSession['conversationHistory'];
         questions_asked: number;
         confidence: number;
         ai_notes: string | null;
@@ -131,10 +138,11 @@ export class SessionManager {
         userId: row.user_id,
         questionsAsked: row.questions_asked,
         confidence: row.confidence,
-        createdAt: new Date(row.created_at).getTime(),
-        expiresAt: new Date(row.expires_at).getTime(),
-        conversationHistory: JSON.parse(row.conversation_history),
-        profile: JSON.parse(row.profile_partial),
+        // pg already returns TIMESTAMP columns as Date objects
+        createdAt: row.created_at.getTime(),
+        expiresAt: row.expires_at.getTime(),
+        conversationHistory: row.conversation_history ?? [],
+        profile: row.profile_partial ?? {},
         aiNotes: row.ai_notes || undefined,
         completed: row.completed,
       };
@@ -146,7 +154,7 @@ export class SessionManager {
       }
 
       // Cache
-      this.sessionCache.set(sessionId, session);
+      this.cacheSession(session);
 
       return session;
     } catch (error) {
@@ -202,14 +210,16 @@ export class SessionManager {
       await this.db.query(
         `UPDATE conversation_sessions SET
           conversation_history = $1,
-          profile_partial = $2,
+          profile_partial = COALESCE($2::jsonb, profile_partial),
           questions_asked = $3,
           confidence = $4,
           last_activity_at = CURRENT_TIMESTAMP
         WHERE session_id = $5`,
         [
           JSON.stringify(session.conversationHistory),
-          JSON.stringify(session.profile),
+          // The profile only changes when something was extracted; otherwise
+          // skip re-serializing it and keep the stored copy
+          extractedInfo ? JSON.stringify(session.profile) : null,
           session.questionsAsked,
           session.confidence,
           sessionId,
@@ -217,7 +227,7 @@ export class SessionManager {
       );
 
       // Update cache
-      this.sessionCache.set(sessionId, session);
+      this.cacheSession(session);
 
       logger.debug('Session updated', {
         sessionId,
@@ -273,11 +283,7 @@ export class SessionManager {
       logger.info('Cleaned up expired sessions', { count });
 
       // Clear from cache
-      for (const [sessionId, session] of this.sessionCache.entries()) {
-        if (session.expiresAt < Date.now()) {
-          this.sessionCache.delete(sessionId);
-        }
-      }
+      this.sessionCache.purgeStale();
 
       return count;
     } catch (error) {
@@ -286,11 +292,23 @@ export class SessionManager {
     }
   }
 
+  /**
+   * Cache a session until it expires
+   */
+  private cacheSession(session: ConversationSession): void {
+    const ttl = session.expiresAt - Date.now();
+    if (ttl > 0) {
+      this.sessionCache.set(session.sessionId, session, { ttl });
+    }
+  }
+
   /**
    * Generate a unique session ID
+   * randomUUID draws from Node's cached entropy pool, so a burst of new
+   * sessions doesn't make a separate randomBytes call (and hex encode) each
    */
   private generateSessionId(): string {
-    return `sess_${randomBytes(16).toString('hex')}`;
+    return `sess_${randomUUID()}`;
   }
 
   /**
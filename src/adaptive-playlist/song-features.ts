@@ -49,10 +49,41 @@ const TAG_DIMENSION_MAP: Record<string, Partial<MUSICDimensions>> = {
   alternative: { unpretentious: 24 },
 };
 
+// Genre keywords matched as substrings of tag names ("indie rock" -> rock,
+// indie), compiled into one alternation so each tag is scanned once
+const GENRE_KEYWORD_PATTERN = new RegExp(
+  [
+    'rock',
+    'pop',
+    'jazz',
+    'classical',
+    'metal',
+    'electronic',
+    'hip hop',
+    'country',
+    'folk',
+    'blues',
+    'reggae',
+    'punk',
+    'indie',
+    'alternative',
+    'r&b',
+    'soul',
+  ].join('|')
+);
+
+// Cache hits only bump access statistics, so collect them briefly and
+// write them in one statement rather than one awaited UPDATE per hit
+const ACCESS_FLUSH_DELAY_MS = 2000;
+
 /**
  * Song feature extractor - integrates with MusicBrainz and Spotify for comprehensive feature extraction
  */
 export class SongFeatureExtractor {
+  // Pending access-count increments per video, drained by flushAccesses()
+  private pendingAccesses = new Map<string, number>();
+  private accessFlushTimer: NodeJS.Timeout | null = null;
+
   constructor(
     private musicBrainz: MusicBrainzClient,
     private spotify: SpotifyClient,
@@ -68,14 +99,27 @@ export class SongFeatureExtractor {
     artist: string,
     releaseYear?: number
   ): Promise<Track | null> {
-    try {
-      // Check if already in database
-      const cached = await this.getCachedFeatures(videoId);
-      if (cached) {
-        logger.debug('Using cached features', { videoId, title });
-        return cached;
-      }
+    // Check if already in database
+    const cached = await this.getCachedFeatures(videoId);
+    if (cached) {
+      logger.debug('Using cached features', { videoId, title });
+      return cached;
+    }
+
+    return this.extractFreshFeatures(videoId, title, artist, releaseYear);
+  }
 
+  /**
+   * Extract features from MusicBrainz/Spotify without checking the database
+   * For callers that already looked the song up with getCachedFeaturesMany()
+   */
+  async extractFreshFeatures(
+    videoId: string,
+    title: string,
+    artist: string,
+    releaseYear?: number
+  ): Promise<Track | null> {
+    try {
       logger.debug('Extracting features for song', { videoId, title, artist });
 
       // Search MusicBrainz for the recording
@@ -102,6 +146,9 @@ export class SongFeatureExtractor {
       // Combine tags
       const allTags = [...tags, ...artistTags];
       const tagNames = allTags.map((t) => t.name.toLowerCase());
+      // Built once so the keyword checks below are hashed lookups rather
+      // than a linear scan of every tag per keyword
+      const tagSet: ReadonlySet<string> = new Set(tagNames);
 
       // Extract MUSIC dimensions from tags
       const dimensions = this.extractMUSICDimensions(allTags);
@@ -120,30 +167,30 @@ export class SongFeatureExtractor {
           : dimensions,
         tempo: spotifyFeatures
           ? this.normalizeSpotifyTempo(spotifyFeatures.tempo)
-          : this.estimateTempoFromTags(tagNames),
-        energy: spotifyFeatures ? spotifyFeatures.energy : this.estimateEnergyFromTags(tagNames),
+          : this.estimateTempoFromTags(tagSet),
+        energy: spotifyFeatures ? spotifyFeatures.energy : this.estimateEnergyFromTags(tagSet),
         complexity: spotifyFeatures
           ? this.calculateComplexityFromSpotify(spotifyFeatures)
-          : this.estimateComplexityFromTags(tagNames),
+          : this.estimateComplexityFromTags(tagSet),
         mode: spotifyFeatures
           ? this.normalizeSpotifyMode(spotifyFeatures.mode)
-          : this.estimateModeFromTags(tagNames),
-        predictability: this.estimatePredictabilityFromTags(tagNames),
-        consonance: this.estimateConsonanceFromTags(tagNames),
+          : this.estimateModeFromTags(tagSet),
+        predictability: this.estimatePredictabilityFromTags(tagSet),
+        consonance: this.estimateConsonanceFromTags(tagSet),
         valence: spotifyFeatures
           ? this.normalizeSpotifyValence(spotifyFeatures.valence)
-          : this.estimateValenceFromTags(tagNames),
+          : this.estimateValenceFromTags(tagSet),
         arousal: spotifyFeatures
           ? this.normalizeSpotifyEnergy(spotifyFeatures.energy)
-          : this.estimateArousalFromTags(tagNames),
+          : this.estimateArousalFromTags(tagSet),
         genres: this.extractGenres(allTags),
         tags: tagNames,
         popularity: this.estimatePopularity(allTags),
-        mainstream: this.isMainstream(allTags),
+        mainstream: this.isMainstream(tagSet),
         isTrending: false,
         hasLyrics: spotifyFeatures
           ? spotifyFeatures.instrumentalness < 0.5
-          : !tagNames.includes('instrumental'),
+          : !tagSet.has('instrumental'),
         userPlayCount: 0,
         isNewArtist: true,
         artistFamiliarity: 0,
@@ -308,27 +355,8 @@ export class SongFeatureExtractor {
    * Extract genres from tags (top genres only)
    */
   private extractGenres(tags: { name: string; count: number }[]): string[] {
-    const genreKeywords = [
-      'rock',
-      'pop',
-      'jazz',
-      'classical',
-      'metal',
-      'electronic',
-      'hip hop',
-      'country',
-      'folk',
-      'blues',
-      'reggae',
-      'punk',
-      'indie',
-      'alternative',
-      'r&b',
-      'soul',
-    ];
-
     return tags
-      .filter((t) => genreKeywords.some((g) => t.name.toLowerCase().includes(g)))
+      .filter((t) => GENRE_KEYWORD_PATTERN.test(t.name.toLowerCase()))
       .sort((a, b) => b.count - a.count)
       .slice(0, 5)
       .map((t) => t.name.toLowerCase());
@@ -337,71 +365,71 @@ export class SongFeatureExtractor {
   /**
    * Estimate tempo from tags (normalized to 0-35)
    */
-  private estimateTempoFromTags(tags: string[]): number {
-    if (tags.includes('fast') || tags.includes('uptempo')) return 28;
-    if (tags.includes('slow') || tags.includes('downtempo')) return 8;
-    if (tags.includes('moderate')) return 17;
+  private estimateTempoFromTags(tags: ReadonlySet<string>): number {
+    if (tags.has('fast') || tags.has('uptempo')) return 28;
+    if (tags.has('slow') || tags.has('downtempo')) return 8;
+    if (tags.has('moderate')) return 17;
     return 17; // Default middle
   }
 
   /**
    * Estimate energy from tags (0-1)
    */
-  private estimateEnergyFromTags(tags: string[]): number {
-    if (tags.includes('energetic') || tags.includes('loud') || tags.includes('aggressive'))
+  private estimateEnergyFromTags(tags: ReadonlySet<string>): number {
+    if (tags.has('energetic') || tags.has('loud') || tags.has('aggressive'))
       return 0.9;
-    if (tags.includes('calm') || tags.includes('relaxing') || tags.includes('ambient')) return 0.2;
+    if (tags.has('calm') || tags.has('relaxing') || tags.has('ambient')) return 0.2;
     return 0.5;
   }
 
   /**
    * Estimate complexity from tags (0-1)
    */
-  private estimateComplexityFromTags(tags: string[]): number {
+  private estimateComplexityFromTags(tags: ReadonlySet<string>): number {
     if (
-      tags.includes('progressive') ||
-      tags.includes('experimental') ||
-      tags.includes('classical')
+      tags.has('progressive') ||
+      tags.has('experimental') ||
+      tags.has('classical')
     )
       return 0.8;
-    if (tags.includes('simple') || tags.includes('pop')) return 0.3;
+    if (tags.has('simple') || tags.has('pop')) return 0.3;
     return 0.5;
   }
 
   /**
    * Estimate mode from tags (0=minor, 17.5=neutral, 35=major)
    */
-  private estimateModeFromTags(tags: string[]): number {
-    if (tags.includes('happy') || tags.includes('uplifting')) return 30;
-    if (tags.includes('sad') || tags.includes('melancholic')) return 5;
+  private estimateModeFromTags(tags: ReadonlySet<string>): number {
+    if (tags.has('happy') || tags.has('uplifting')) return 30;
+    if (tags.has('sad') || tags.has('melancholic')) return 5;
     return 17;
   }
 
   /**
    * Estimate predictability from tags (0-35)
    */
-  private estimatePredictabilityFromTags(tags: string[]): number {
-    if (tags.includes('experimental') || tags.includes('avant-garde')) return 5;
-    if (tags.includes('pop') || tags.includes('mainstream')) return 30;
+  private estimatePredictabilityFromTags(tags: ReadonlySet<string>): number {
+    if (tags.has('experimental') || tags.has('avant-garde')) return 5;
+    if (tags.has('pop') || tags.has('mainstream')) return 30;
     return 17;
   }
 
   /**
    * Estimate consonance from tags (0-35)
    */
-  private estimateConsonanceFromTags(tags: string[]): number {
-    if (tags.includes('dissonant') || tags.includes('harsh')) return 8;
-    if (tags.includes('melodic') || tags.includes('harmonious')) return 28;
+  private estimateConsonanceFromTags(tags: ReadonlySet<string>): number {
+    if (tags.has('dissonant') || tags.has('harsh')) return 8;
+    if (tags.has('melodic') || tags.has('harmonious')) return 28;
     return 22; // Default slightly consonant
   }
 
   /**
    * Estimate valence from tags (0-35)
    */
-  private estimateValenceFromTags(tags: string[]): number {
-    if (tags.includes('happy') || tags.includes('uplifting') || tags.includes('cheerful'))
+  private estimateValenceFromTags(tags: ReadonlySet<string>): number {
+    if (tags.has('happy') || tags.has('uplifting') || tags.has('cheerful'))
       return 30;
-    if (tags.includes('sad') || tags.includes('melancholic') || tags.includes('depressing'))
+    if (tags.has('sad') || tags.has('melancholic') || tags.has('depressing'))
       return 5;
     return 17;
   }
@@ -409,10 +437,10 @@ export class SongFeatureExtractor {
   /**
    * Estimate arousal from tags (0-35)
    */
-  private estimateArousalFromTags(tags: string[]): number {
-    if (tags.includes('energetic') || tags.includes('exciting') || tags.includes('intense'))
+  private estimateArousalFromTags(tags: ReadonlySet<string>): number {
+    if (tags.has('energetic') || tags.has('exciting') || tags.has('intense'))
       return 30;
-    if (tags.includes('calm') || tags.includes('relaxing') || tags.includes('peaceful')) return 5;
+    if (tags.has('calm') || tags.has('relaxing') || tags.has('peaceful')) return 5;
     return 17;
   }
 
@@ -428,9 +456,8 @@ export class SongFeatureExtractor {
   /**
    * Check if mainstream based on tags
    */
-  private isMainstream(tags: { name: string; count: number }[]): boolean {
-    const tagNames = tags.map((t) => t.name.toLowerCase());
-    return tagNames.includes('pop') || tagNames.includes('mainstream') || tagNames.includes('top 40');
+  private isMainstream(tags: ReadonlySet<string>): boolean {
+    return tags.has('pop') || tags.has('mainstream') || tags.has('top 40');
   }
 
   /**
@@ -488,47 +515,120 @@ export class SongFeatureExtractor {
 
       if (result.rows.length === 0) return null;
 
-      const row = result.rows[0] as Record<string, unknown>;
-
-      // Update access tracking
-      await this.db.query('SELECT update_song_access($1)', [videoId]);
-
-      return {
-        videoId: row.video_id as string,
-        title: row.title as string,
-        artist: row.artist as string,
-        releaseYear: row.release_year as number,
-        dimensions: {
-          mellow: row.mellow as number,
-          sophisticated: row.sophisticated as number,
-          intense: row.intense as number,
-          contemporary: row.contemporary as number,
-          unpretentious: row.unpretentious as number,
-        },
-        tempo: row.tempo_normalized as number,
-        energy: row.energy as number,
-        complexity: row.complexity as number,
-        mode: row.mode as number,
-        predictability: row.predictability as number,
-        consonance: row.consonance as number,
-        valence: row.valence as number,
-        arousal: row.arousal as number,
-        genres: (row.genres as string[]) || [],
-        tags: (row.tags as string[]) || [],
-        popularity: row.popularity as number,
-        mainstream: row.is_mainstream as boolean,
-        isTrending: false,
-        hasLyrics: row.has_lyrics as boolean,
-        userPlayCount: 0,
-        isNewArtist: true,
-        artistFamiliarity: 0,
-      };
+      // Update access tracking (batched, off the read path)
+      this.recordAccess(videoId);
+
+      return this.rowToTrack(result.rows[0] as Record<string, unknown>);
     } catch (error) {
       logger.error('Failed to get cached features', { error, videoId });
       return null;
     }
   }
 
+  /**
+   * Get cached features for many songs in a single query
+   * Songs without a cached row are simply absent from the returned map
+   */
+  async getCachedFeaturesMany(videoIds: string[]): Promise<Map<string, Track>> {
+    const tracks = new Map<string, Track>();
+    if (videoIds.length === 0) return tracks;
+
+    try {
+      const result = await this.db.query(
+        'SELECT * FROM song_features WHERE video_id = ANY($1::text[])',
+        [videoIds]
+      );
+
+      for (const row of result.rows) {
+        const track = this.rowToTrack(row as Record<string, unknown>);
+        tracks.set(track.videoId, track);
+        this.recordAccess(track.videoId);
+      }
+    } catch (error) {
+      logger.error('Failed to get cached features', { error, count: videoIds.length });
+    }
+
+    return tracks;
+  }
+
+  /**
+   * Map a song_features row to a Track
+   */
+  private rowToTrack(row: Record<string, unknown>): Track {
+    return {
+      videoId: row.video_id as string,
+      title: row.title as string,
+      artist: row.artist as string,
+      releaseYear: row.release_year as number,
+      dimensions: {
+        mellow: row.mellow as number,
+        sophisticated: row.sophisticated as number,
+        intense: row.intense as number,
+        contemporary: row.contemporary as number,
+        unpretentious: row.unpretentious as number,
+      },
+      tempo: row.tempo_normalized as number,
+      energy: row.energy as number,
+      complexity: row.complexity as number,
+      mode: row.mode as number,
+      predictability: row.predictability as number,
+      consonance: row.consonance as number,
+      valence: row.valence as number,
+      arousal: row.arousal as number,
+      genres: (row.genres as string[]) || [],
+      tags: (row.tags as string[]) || [],
+      popularity: row.popularity as number,
+      mainstream: row.is_mainstream as boolean,
+      isTrending: false,
+      hasLyrics: row.has_lyrics as boolean,
+      userPlayCount: 0,
+      isNewArtist: true,
+      artistFamiliarity: 0,
+    };
+  }
+
+  /**
+   * Queue an access-count increment for a cached song
+   */
+  private recordAccess(videoId: string): void {
+    this.pendingAccesses.set(videoId, (this.pendingAccesses.get(videoId) ?? 0) + 1);
+
+    if (!this.accessFlushTimer) {
+      this.accessFlushTimer = setTimeout(() => {
+        this.accessFlushTimer = null;
+        void this.flushAccesses();
+      }, ACCESS_FLUSH_DELAY_MS);
+      // Best-effort statistics shouldn't keep the process alive
+      this.accessFlushTimer.unref();
+    }
+  }
+
+  /**
+   * Write queued access counts in a single UPDATE
+   * Repeated hits on the same song collapse into one row update
+   */
+  private async flushAccesses(): Promise<void> {
+    const batch = this.pendingAccesses;
+    this.pendingAccesses = new Map();
+    if (batch.size === 0) return;
+
+    try {
+      await this.db.query(
+        `UPDATE song_features AS sf SET
+          last_accessed_at = CURRENT_TIMESTAMP,
+          access_count = sf.access_count + a.hits
+        FROM unnest($1::text[], $2::int[]) AS a(video_id, hits)
+        WHERE sf.video_id = a.video_id`,
+        [Array.from(batch.keys()), Array.from(batch.values())]
+      );
+    } catch (error) {
+      logger.error('Failed to record song access', {
+        error: error instanceof Error ? error.message : 'Unknown error',
+        count: batch.size,
+      });
+    }
+  }
+
   /**
    * Cache features in database
    */
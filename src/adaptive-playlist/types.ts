@@ -138,7 +138,7 @@ export interface Track {
 
   // User-specific (populated from history)
   userPlayCount: number;
-  lastPlayedDate?: Date;
+  lastPlayedAt?: number; // epoch ms
   isNewArtist: boolean;
   artistFamiliarity: number; // 0-1
 
@@ -0,0 +1,80 @@
+import type { NextFunction, Request, Response } from 'express';
+import type { AuthInfo } from '@modelcontextprotocol/sdk/server/auth/types.js';
+import { tokenStore } from './token-store.js';
+import { createLogger } from '../utils/logger.js';
+
+const logger = createLogger('session-binding');
+
+const BEARER_PREFIX = 'Bearer ';
+const BEARER_PREFIX_LOWER = BEARER_PREFIX.toLowerCase();
+// ASCII letters differ from their lowercase form only in this bit
+const ASCII_CASE_BIT = 0x20;
+
+/**
+ * Extract the token from an Authorization header, or null if it isn't a bearer token
+ * The scheme is case-insensitive, matching the SDK's bearer auth middleware
+ */
+function extractBearerToken(authHeader: string | undefined): string | null {
+  if (!authHeader || authHeader.length <= BEARER_PREFIX.length) {
+    return null;
+  }
+  if (!hasBearerScheme(authHeader)) {
+    return null;
+  }
+  return authHeader.slice(BEARER_PREFIX.length).trim() || null;
+}
+
+/**
+ * Case-insensitive check for the bearer scheme, comparing char codes in
+ * place so no casing of the header allocates a lowercased copy
+ */
+function hasBearerScheme(authHeader: string): boolean {
+  const schemeLength = BEARER_PREFIX_LOWER.length - 1;
+  for (let i = 0; i < schemeLength; i++) {
+    if ((authHeader.charCodeAt(i) | ASCII_CASE_BIT) !== BEARER_PREFIX_LOWER.charCodeAt(i)) {
+      return false;
+    }
+  }
+  // The separator must be an actual space
+  return authHeader.charCodeAt(schemeLength) === BEARER_PREFIX_LOWER.charCodeAt(schemeLength);
+}
+
+/**
+ * Store the authenticated token for YouTube Music API calls and run the rest
+ * of the request with its MCP session bound as the current session.
+ * Mount after the body parser: body-parser resumes from socket events, which
+ * don't carry the AsyncLocalStorage context, so binding first would leave
+ * the route handler and tool calls without a session.
+ */
+export function bindSessionToken(
+  req: Request & { auth?: AuthInfo },
+  _res: Response,
+  next: NextFunction
+): void {
+  // requireBearerAuth has already parsed and verified the header
+  const token = req.auth?.token ?? extractBearerToken(req.headers.authorization);
+  if (token) {
+    // Store token with MCP session ID
+    const sessionId = req.headers['mcp-session-id'] as string | undefined;
+    if (sessionId) {
+      // The stored entry only changes when the client re-authenticates,
+      // so skip rewriting it while the session still holds this token
+      if (tokenStore.getToken(sessionId)?.accessToken !== token) {
+        // Note: We don't have a refresh token from the bearer token itself
+        // The OAuth provider handles token refresh
+        tokenStore.setToken(sessionId, {
+          accessToken: token,
+          refreshToken: '', // Not available from bearer auth
+          // Expiry reported by tokeninfo, falling back to 1 hour
+          expiresAt: req.auth?.expiresAt ?? Date.now() + 3600000,
+        });
+        logger.debug('Token stored for YouTube Music API calls', { sessionId });
+      }
+      // Bind the session to this request so concurrent sessions don't
+      // see each other's token through the shared store
+      tokenStore.runWithSession(sessionId, next);
+      return;
+    }
+  }
+  next();
+}
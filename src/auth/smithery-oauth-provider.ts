@@ -1,12 +1,17 @@
 import { ProxyOAuthServerProvider } from '@modelcontextprotocol/sdk/server/auth/providers/proxyProvider.js';
 import type { AuthInfo } from '@modelcontextprotocol/sdk/server/auth/types.js';
 import type { AuthorizationParams } from '@modelcontextprotocol/sdk/server/auth/provider.js';
-import type { OAuthClientInformationFull } from '@modelcontextprotocol/sdk/shared/auth.js';
+import type { OAuthClientInformationFull, OAuthTokens } from '@modelcontextprotocol/sdk/shared/auth.js';
 import type { OAuthRegisteredClientsStore } from '@modelcontextprotocol/sdk/server/auth/clients.js';
+import type { FetchLike } from '@modelcontextprotocol/sdk/shared/transport.js';
 import type { OAuthProvider } from '@smithery/sdk';
-import type { Response } from 'express';
+import type { Response as ExpressResponse } from 'express';
+import got, { type Method } from 'got';
+import { LRUCache } from 'lru-cache';
 import { config } from '../config.js';
 import { createLogger } from '../utils/logger.js';
+import { httpAgent } from '../utils/http-agent.js';
+import { hashToken } from '../utils/hash.js';
 import { randomUUID } from 'crypto';
 
 const logger = createLogger('smithery-oauth');
@@ -15,15 +20,140 @@ const logger = createLogger('smithery-oauth');
 const GOOGLE_AUTH_URL = 'https://accounts.google.com/o/oauth2/v2/auth';
 const GOOGLE_TOKEN_URL = 'https://oauth2.googleapis.com/token';
 const GOOGLE_REVOKE_URL = 'https://oauth2.googleapis.com/revoke';
+const GOOGLE_TOKENINFO_URL = 'https://oauth2.googleapis.com/tokeninfo';
+// Only the token varies per verification, so append it to a fixed prefix
+// rather than having got build a URLSearchParams for every request
+const GOOGLE_TOKENINFO_QUERY_PREFIX = `${GOOGLE_TOKENINFO_URL}?access_token=`;
+
+/**
+ * Fields read from Google's tokeninfo response
+ */
+interface GoogleTokenInfo {
+  aud: string;
+  scope: string;
+  expires_in: string;
+  email?: string;
+}
 
 // OAuth scopes for YouTube Music
 const YOUTUBE_SCOPES = [
   'https://www.googleapis.com/auth/youtube',
   'https://www.googleapis.com/auth/youtube.readonly',
 ];
+const YOUTUBE_SCOPE_STRING = YOUTUBE_SCOPES.join(' ');
+
+// Static fields swapped onto a client before talking to Google upstream
+const GOOGLE_CLIENT_CREDENTIALS = {
+  client_id: config.googleClientId,
+  client_secret: config.googleClientSecret,
+  scope: YOUTUBE_SCOPE_STRING,
+} as const;
+
+// Google authorization URL up to the per-request parameters. Client ID,
+// our callback, scopes and PKCE method never change, so they are encoded
+// once; only the challenge, state and resource are appended per login.
+// Null when GOOGLE_REDIRECT_URI is unset (authorize() rejects that case).
+const GOOGLE_AUTH_URL_PREFIX = config.googleRedirectUri
+  ? `${GOOGLE_AUTH_URL}?${new URLSearchParams({
+    client_id: GOOGLE_CLIENT_CREDENTIALS.client_id,
+    response_type: 'code',
+    redirect_uri: config.googleRedirectUri,
+    code_challenge_method: 'S256',
+    scope: YOUTUBE_SCOPE_STRING,
+  }).toString()}&`
+  : null;
+
+// Callback URL advertised to MCP clients, resolved once from config
+const OAUTH_CALLBACK_URI =
+  config.googleRedirectUri || `http://localhost:${config.port}/oauth/callback`;
+
+// Client configuration handed to the proxy provider for every lookup.
+// Uses our Google OAuth client credentials, not the MCP client's ID.
+const GOOGLE_CLIENT_INFO: OAuthClientInformationFull = {
+  client_id: GOOGLE_CLIENT_CREDENTIALS.client_id,
+  client_secret: GOOGLE_CLIENT_CREDENTIALS.client_secret,
+  // Accept common redirect patterns for MCP clients
+  redirect_uris: [
+    'http://localhost:3000/callback',
+    'http://localhost:8080/callback',
+    'http://127.0.0.1:3000/callback',
+    'http://127.0.0.1:8080/callback',
+    OAUTH_CALLBACK_URI,
+  ],
+  grant_types: ['authorization_code', 'refresh_token'],
+  response_types: ['code'],
+  scope: YOUTUBE_SCOPE_STRING,
+  token_endpoint_auth_method: 'client_secret_post',
+};
+
+// Upstream timeout for token, refresh, revoke and tokeninfo calls
+const GOOGLE_REQUEST_TIMEOUT_MS = 10000;
+
+/**
+ * Fetch implementation for the proxy provider's calls to Google.
+ * The SDK otherwise goes through the global fetch, so code exchanges,
+ * refreshes and revocations would sit on a separate connection pool from
+ * tokeninfo; routing them through got keeps every OAuth round-trip on the
+ * shared keep-alive agents.
+ */
+const googleFetch: FetchLike = async (url, init) => {
+  const response = await got(url, {
+    method: (init?.method ?? 'GET') as Method,
+    // The SDK may pass a Headers instance or a URLSearchParams body;
+    // normalise both into the plain forms got expects
+    headers: Object.fromEntries(new Headers(init?.headers)),
+    body: init?.body == null ? undefined : String(init.body),
+    agent: httpAgent,
+    http2: true,
+    throwHttpErrors: false,
+    timeout: { request: GOOGLE_REQUEST_TIMEOUT_MS },
+  });
 
-// In-memory store for dynamically registered clients
-const registeredClients = new Map<string, OAuthClientInformationFull>();
+  const contentType = response.headers['content-type'];
+  return new Response(response.rawBody.length > 0 ? response.rawBody : null, {
+    status: response.statusCode,
+    ...(contentType && { headers: { 'Content-Type': contentType } }),
+  });
+};
+
+// In-memory store for dynamically registered clients.
+// Bounded and idle-expired so abandoned registrations don't accumulate;
+// clients that keep using their ID stay alive via updateAgeOnGet.
+const MAX_REGISTERED_CLIENTS = 1000;
+const REGISTERED_CLIENT_TTL_MS = 7 * 24 * 60 * 60 * 1000;
+const registeredClients = new LRUCache<string, OAuthClientInformationFull>({
+  max: MAX_REGISTERED_CLIENTS,
+  ttl: REGISTERED_CLIENT_TTL_MS,
+  updateAgeOnGet: true,
+});
+
+// Tokens minted by a refresh, keyed by a hash of the refresh token (never
+// the plaintext) plus the requested scopes/resource. Several sessions of the
+// same user refreshing around the same time get the already-minted token
+// instead of each round-tripping to Google.
+const MAX_REFRESHED_TOKENS = 1000;
+const TOKEN_EXPIRY_LEEWAY_SECONDS = 30;
+const refreshedTokens = new LRUCache<string, { tokens: OAuthTokens; expiresAt: number }>({
+  max: MAX_REFRESHED_TOKENS,
+});
+const pendingRefreshes = new Map<string, Promise<OAuthTokens>>();
+
+// Successful tokeninfo verifications, keyed by access-token hash. Every
+// authenticated request is verified, so repeat requests with the same token
+// skip the Google round-trip. Entries live for the token's remaining
+// lifetime, capped so a revoked token stops being accepted soon after.
+// Entries are frozen: the same object is handed to every request that
+// presents the token, so no request may modify it.
+const MAX_VERIFIED_TOKENS = 1000;
+const MAX_VERIFIED_TOKEN_TTL_MS = 5 * 60 * 1000;
+const verifiedTokens = new LRUCache<string, Readonly<AuthInfo>>({ max: MAX_VERIFIED_TOKENS });
+
+/**
+ * Build the refreshed-token cache key for a refresh request
+ */
+function refreshCacheKey(refreshToken: string, scopes?: string[], resource?: URL): string {
+  return `${hashToken(refreshToken)}|${scopes?.join(' ') ?? ''}|${resource?.href ?? ''}`;
+}
 
 /**
  * Extended ProxyOAuthServerProvider with dynamic client registration support
@@ -67,7 +197,7 @@ class DynamicClientProxyProvider extends ProxyOAuthServerProvider {
           client_id: clientId,
           client_secret: clientSecret,
           client_id_issued_at: Math.floor(Date.now() / 1000),
-          scope: YOUTUBE_SCOPES.join(' '),
+          scope: YOUTUBE_SCOPE_STRING,
         };
 
         registeredClients.set(clientId, fullClientInfo);
@@ -94,12 +224,11 @@ class DynamicClientProxyProvider extends ProxyOAuthServerProvider {
   override async authorize(
     client: OAuthClientInformationFull,
     params: AuthorizationParams,
-    res: Response
+    res: ExpressResponse
   ): Promise<void> {
-    // Use our callback endpoint as the redirect_uri
+    // The prefix carries our callback endpoint as the redirect_uri
     // Google will redirect here after user authorization
-    const ourRedirectUri = config.googleRedirectUri;
-    if (!ourRedirectUri) {
+    if (!GOOGLE_AUTH_URL_PREFIX) {
       throw new Error('GOOGLE_REDIRECT_URI environment variable is required for OAuth');
     }
 
@@ -117,30 +246,25 @@ class DynamicClientProxyProvider extends ProxyOAuthServerProvider {
     });
     const encodedState = Buffer.from(stateData).toString('base64url');
 
-    // Create a client object with Google's credentials for the authorization request
-    const googleClient: OAuthClientInformationFull = {
-      ...client,
-      client_id: config.googleClientId,
-      client_secret: config.googleClientSecret,
-      scope: YOUTUBE_SCOPES.join(' '),
-    };
-
-    const paramsWithFixes: AuthorizationParams = {
-      ...params,
-      scopes: YOUTUBE_SCOPES,
-      redirectUri: ourRedirectUri, // Use OUR registered callback
+    // Same parameters the proxy provider would send for Google's client,
+    // with only the per-request ones encoded here
+    const requestParams = new URLSearchParams({
+      code_challenge: params.codeChallenge,
       state: encodedState, // Store client's redirect_uri in state
-    };
+    });
+    if (params.resource) {
+      requestParams.set('resource', params.resource.href);
+    }
 
     logger.debug('Authorizing with Google', {
-      scopes: paramsWithFixes.scopes,
-      ourRedirectUri,
+      scopes: YOUTUBE_SCOPES,
+      ourRedirectUri: config.googleRedirectUri,
       clientRedirectUri,
       registeredClientId: client.client_id,
-      googleClientId: googleClient.client_id,
+      googleClientId: GOOGLE_CLIENT_CREDENTIALS.client_id,
     });
 
-    return super.authorize(googleClient, paramsWithFixes, res);
+    res.redirect(GOOGLE_AUTH_URL_PREFIX + requestParams.toString());
   }
 
   /**
@@ -165,9 +289,7 @@ class DynamicClientProxyProvider extends ProxyOAuthServerProvider {
     // But we need Google's credentials to exchange the code with Google
     const googleClient: OAuthClientInformationFull = {
       ...client,
-      client_id: config.googleClientId,
-      client_secret: config.googleClientSecret,
-      scope: YOUTUBE_SCOPES.join(' '),
+      ...GOOGLE_CLIENT_CREDENTIALS,
     };
 
     logger.info('Exchanging authorization code', {
@@ -201,6 +323,49 @@ class DynamicClientProxyProvider extends ProxyOAuthServerProvider {
       throw error;
     }
   }
+
+  /**
+   * Override exchangeRefreshToken to reuse tokens minted by a recent refresh
+   * Concurrent refreshes with the same refresh token share one upstream call
+   */
+  override async exchangeRefreshToken(
+    client: OAuthClientInformationFull,
+    refreshToken: string,
+    scopes?: string[],
+    resource?: URL
+  ): Promise<OAuthTokens> {
+    const key = refreshCacheKey(refreshToken, scopes, resource);
+
+    const cached = refreshedTokens.get(key);
+    if (cached) {
+      logger.debug('Reusing recently refreshed token');
+      return {
+        ...cached.tokens,
+        expires_in: Math.floor((cached.expiresAt - Date.now()) / 1000),
+      };
+    }
+
+    const pending = pendingRefreshes.get(key);
+    if (pending) {
+      return pending;
+    }
+
+    const request = super.exchangeRefreshToken(client, refreshToken, scopes, resource)
+      .then((tokens) => {
+        // Only cache when the lifetime is known and outlasts the leeway
+        if (tokens.expires_in && tokens.expires_in > TOKEN_EXPIRY_LEEWAY_SECONDS) {
+          const ttl = (tokens.expires_in - TOKEN_EXPIRY_LEEWAY_SECONDS) * 1000;
+          refreshedTokens.set(key, { tokens, expiresAt: Date.now() + tokens.expires_in * 1000 }, { ttl });
+        }
+        return tokens;
+      })
+      .finally(() => {
+        pendingRefreshes.delete(key);
+      });
+    pendingRefreshes.set(key, request);
+
+    return request;
+  }
 }
 
 /**
@@ -217,26 +382,33 @@ function createOAuthProvider(): OAuthProvider {
 
     // Verify Google access tokens
     verifyAccessToken: async (token: string): Promise<AuthInfo> => {
+      const cacheKey = hashToken(token);
+      const cached = verifiedTokens.get(cacheKey);
+      if (cached) {
+        return cached;
+      }
+
       try {
-        const response = await fetch(
-          `https://oauth2.googleapis.com/tokeninfo?access_token=${token}`
-        );
+        // Runs before every authenticated request, so go through the shared
+        // keep-alive pool rather than opening a fresh connection to Google
+        const response = await got.get(GOOGLE_TOKENINFO_QUERY_PREFIX + encodeURIComponent(token), {
+          agent: httpAgent,
+          // Google negotiates HTTP/2 via ALPN, so concurrent verifications
+          // multiplex over one session instead of each taking a socket
+          http2: true,
+          throwHttpErrors: false,
+          timeout: { request: GOOGLE_REQUEST_TIMEOUT_MS },
+        });
 
-        if (!response.ok) {
-          const errorText = await response.text();
+        if (response.statusCode !== 200) {
           logger.error('Google tokeninfo failed', {
-            status: response.status,
-            error: errorText
+            status: response.statusCode,
+            error: response.body
           });
-          throw new Error(`Token validation failed: ${response.status}`);
+          throw new Error(`Token validation failed: ${response.statusCode}`);
         }
 
-        const tokenInfo = (await response.json()) as {
-          aud: string;
-          scope: string;
-          expires_in: string;
-          email?: string;
-        };
+        const tokenInfo = JSON.parse(response.body) as GoogleTokenInfo;
 
         // Log token info for debugging (not the actual token)
         logger.debug('Token info received', {
@@ -255,12 +427,21 @@ function createOAuthProvider(): OAuthProvider {
           throw new Error(`Token audience mismatch: got ${tokenInfo.aud}, expected ${config.googleClientId}`);
         }
 
-        return {
+        const expiresInMs = parseInt(tokenInfo.expires_in) * 1000;
+        const authInfo: Readonly<AuthInfo> = Object.freeze({
           token,
           clientId: config.googleClientId,
           scopes: tokenInfo.scope.split(' '),
-          expiresAt: Date.now() + parseInt(tokenInfo.expires_in) * 1000,
-        };
+          expiresAt: Date.now() + expiresInMs,
+        });
+
+        if (expiresInMs > 0) {
+          verifiedTokens.set(cacheKey, authInfo, {
+            ttl: Math.min(expiresInMs, MAX_VERIFIED_TOKEN_TTL_MS),
+          });
+        }
+
+        return authInfo;
       } catch (error) {
         const errorMessage = error instanceof Error ? error.message : 'Unknown error';
         logger.error('Token verification failed', { error: errorMessage });
@@ -269,25 +450,9 @@ function createOAuthProvider(): OAuthProvider {
     },
 
     // Get client configuration
-    // Use our Google OAuth client credentials, not the MCP client's ID
-    getClient: async (_clientId: string) => {
-      return {
-        client_id: config.googleClientId,
-        client_secret: config.googleClientSecret,
-        // Accept common redirect patterns for MCP clients
-        redirect_uris: [
-          'http://localhost:3000/callback',
-          'http://localhost:8080/callback',
-          'http://127.0.0.1:3000/callback',
-          'http://127.0.0.1:8080/callback',
-          config.googleRedirectUri || `http://localhost:${config.port}/oauth/callback`,
-        ],
-        grant_types: ['authorization_code', 'refresh_token'],
-        response_types: ['code'],
-        scope: YOUTUBE_SCOPES.join(' '),
-        token_endpoint_auth_method: 'client_secret_post',
-      };
-    },
+    getClient: async (_clientId: string) => GOOGLE_CLIENT_INFO,
+
+    fetch: googleFetch,
   });
 
   logger.info('Google OAuth provider initialized', {
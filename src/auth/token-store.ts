@@ -3,9 +3,15 @@ import { config } from '../config.js';
 import { promises as fs } from 'fs';
 import { createCipheriv, createDecipheriv, randomBytes } from 'crypto';
 import path from 'path';
+import { AsyncLocalStorage } from 'node:async_hooks';
+import { LRUCache } from 'lru-cache';
 
 const logger = createLogger('token-store');
 
+// Every MCP session gets its own entry; cap them so long-running
+// deployments don't pin tokens for sessions that never come back
+const MAX_STORED_TOKENS = 500;
+
 export interface StoredToken {
   accessToken: string;
   refreshToken: string;
@@ -16,12 +22,19 @@ export interface StoredToken {
  * Shared token store for OAuth tokens
  * Used by both Smithery OAuth provider and YouTubeMusicClient
  * Persists tokens to encrypted file for Railway deployment
+ * Tokens are held decrypted in memory: the file is decrypted once at startup
+ * and only encrypted again on (batched) saves, never on lookups
  */
 class TokenStore {
-  private tokens = new Map<string, StoredToken>();
+  private tokens = new LRUCache<string, StoredToken>({ max: MAX_STORED_TOKENS });
+  // Session restored from the token file; requests bind their own session
+  // through requestSession instead of mutating this
   private currentSessionId: string | null = null;
+  private requestSession = new AsyncLocalStorage<string>();
   private saveTimeout: NodeJS.Timeout | null = null;
   private isInitialized = false;
+  private storageDirReady = false;
+  private encryptionKey: Buffer | null = null;
 
   constructor() {
     // Load tokens from file asynchronously
@@ -45,8 +58,21 @@ class TokenStore {
    * Store tokens for a session
    */
   setToken(sessionId: string, token: StoredToken): void {
+    const existing = this.tokens.get(sessionId);
     this.tokens.set(sessionId, token);
-    this.currentSessionId = sessionId;
+    // The current session is bound per request through runWithSession;
+    // concurrent requests must not race on a shared "last stored" session
+
+    // Same credentials re-presented on every request only slide the expiry,
+    // so skip the encrypt + file write round-trip
+    if (
+      existing &&
+      existing.accessToken === token.accessToken &&
+      existing.refreshToken === token.refreshToken
+    ) {
+      return;
+    }
+
     logger.info('Token stored', { sessionId });
     this.scheduleSave();
   }
@@ -62,42 +88,45 @@ class TokenStore {
    * Get token for the current active session
    */
   getCurrentToken(): StoredToken | undefined {
-    if (!this.currentSessionId) {
+    const sessionId = this.getCurrentSessionId();
+    if (!sessionId) {
       return undefined;
     }
-    return this.tokens.get(this.currentSessionId);
+    return this.tokens.get(sessionId);
   }
 
   /**
    * Get the current session ID
+   * Uses the session bound to the in-flight request, falling back to the
+   * session restored from the token file for callers outside any request
    */
   getCurrentSessionId(): string | null {
-    return this.currentSessionId;
+    return this.requestSession.getStore() ?? this.currentSessionId;
   }
 
   /**
-   * Set the current active session
+   * Run a request handler with its MCP session bound as the current session
    */
-  setCurrentSession(sessionId: string): void {
-    this.currentSessionId = sessionId;
+  runWithSession<T>(sessionId: string, fn: () => T): T {
+    return this.requestSession.run(sessionId, fn);
   }
 
   /**
    * Check if there's an active session with valid token
    */
   hasActiveSession(): boolean {
-    if (!this.currentSessionId) {
+    const sessionId = this.getCurrentSessionId();
+    if (!sessionId) {
       return false;
     }
-    const token = this.tokens.get(this.currentSessionId);
-    return token !== undefined;
+    return this.tokens.has(sessionId);
   }
 
   /**
    * Check if token needs refresh (5 minutes before expiry)
    */
   needsRefresh(sessionId?: string): boolean {
-    const effectiveId = sessionId ?? this.currentSessionId;
+    const effectiveId = sessionId ?? this.getCurrentSessionId();
     if (!effectiveId) {
       return false;
     }
@@ -112,10 +141,14 @@ class TokenStore {
    * Remove token for a session
    */
   removeToken(sessionId: string): void {
-    this.tokens.delete(sessionId);
     if (this.currentSessionId === sessionId) {
       this.currentSessionId = null;
     }
+    // Every closed MCP session lands here, including ones that never
+    // stored a token; only touch the file when something was removed
+    if (!this.tokens.delete(sessionId)) {
+      return;
+    }
     logger.info('Token removed', { sessionId });
     this.scheduleSave();
   }
@@ -131,18 +164,34 @@ class TokenStore {
   }
 
   /**
-   * Schedule a debounced save to file
-   * Prevents excessive writes during rapid token updates
+   * Schedule a batched save to file
+   * Changes made while a save is pending ride along with it, so rapid token
+   * updates cost one write per second at most and a steady stream of them
+   * can't keep postponing the write
    */
   private scheduleSave(): void {
     if (this.saveTimeout) {
-      clearTimeout(this.saveTimeout);
+      return;
     }
     this.saveTimeout = setTimeout(() => {
+      this.saveTimeout = null;
       this.saveToFile().catch(error => {
         logger.error('Failed to save tokens to file', { error });
       });
-    }, 1000); // Debounce for 1 second
+    }, 1000); // Flush at most once per second
+  }
+
+  /**
+   * Write any pending changes to file now
+   * Called on shutdown so updates still waiting on the batch timer aren't lost
+   */
+  async flush(): Promise<void> {
+    if (!this.saveTimeout) {
+      return;
+    }
+    clearTimeout(this.saveTimeout);
+    this.saveTimeout = null;
+    await this.saveToFile();
   }
 
   /**
@@ -153,13 +202,14 @@ class TokenStore {
     const iv = randomBytes(16);
     const cipher = createCipheriv('aes-256-gcm', key, iv);
 
-    let encrypted = cipher.update(text, 'utf8', 'hex');
-    encrypted += cipher.final('hex');
+    // Encrypt to bytes and hex-encode once, rather than hex-encoding each
+    // cipher chunk and concatenating the strings
+    const encrypted = Buffer.concat([cipher.update(text, 'utf8'), cipher.final()]);
 
     const authTag = cipher.getAuthTag();
 
     // Return: iv:authTag:encrypted
-    return `${iv.toString('hex')}:${authTag.toString('hex')}:${encrypted}`;
+    return `${iv.toString('hex')}:${authTag.toString('hex')}:${encrypted.toString('hex')}`;
   }
 
   /**
@@ -175,21 +225,28 @@ class TokenStore {
 
     const iv = Buffer.from(parts[0], 'hex');
     const authTag = Buffer.from(parts[1], 'hex');
-    const encrypted = parts[2];
+    const encrypted = Buffer.from(parts[2], 'hex');
 
     const decipher = createDecipheriv('aes-256-gcm', key, iv);
     decipher.setAuthTag(authTag);
 
-    let decrypted: string = decipher.update(encrypted, 'hex', 'utf8');
-    decrypted += decipher.final('utf8');
-
-    return decrypted;
+    return Buffer.concat([decipher.update(encrypted), decipher.final()]).toString('utf8');
   }
 
   /**
-   * Get encryption key from config or generate a temporary one
+   * Get encryption key from config, decoded once (config is frozen)
    */
   private getEncryptionKey(): Buffer {
+    if (!this.encryptionKey) {
+      this.encryptionKey = this.decodeEncryptionKey();
+    }
+    return this.encryptionKey;
+  }
+
+  /**
+   * Decode the configured encryption key
+   */
+  private decodeEncryptionKey(): Buffer {
     const key = config.encryptionKey;
     if (!key) {
       throw new Error('ENCRYPTION_KEY environment variable is required for token storage');
@@ -214,7 +271,8 @@ class TokenStore {
   private async saveToFile(): Promise<void> {
     try {
       const data = {
-        tokens: Array.from(this.tokens.entries()),
+        // Least-recently-used first so a reload preserves recency order
+        tokens: Array.from(this.tokens.rentries()),
         currentSessionId: this.currentSessionId,
         savedAt: new Date().toISOString(),
       };
@@ -222,9 +280,11 @@ class TokenStore {
       const json = JSON.stringify(data);
       const encrypted = this.encrypt(json);
 
-      // Ensure directory exists
-      const dir = path.dirname(config.tokenStoragePath);
-      await fs.mkdir(dir, { recursive: true });
+      // Ensure directory exists (only needs checking once per process)
+      if (!this.storageDirReady) {
+        await fs.mkdir(path.dirname(config.tokenStoragePath), { recursive: true });
+        this.storageDirReady = true;
+      }
 
       // Write to temp file first, then rename (atomic operation)
       const tempPath = `${config.tokenStoragePath}.tmp`;
@@ -256,17 +316,18 @@ class TokenStore {
         savedAt: string;
       };
 
-      this.tokens = new Map(data.tokens);
       this.currentSessionId = data.currentSessionId;
 
-      // Clean up expired tokens
+      // Restore tokens, skipping any that have already expired
       const now = Date.now();
       let expiredCount = 0;
-      for (const [sessionId, token] of this.tokens.entries()) {
+      this.tokens.clear();
+      for (const [sessionId, token] of data.tokens) {
         if (token.expiresAt < now) {
-          this.tokens.delete(sessionId);
           expiredCount++;
+          continue;
         }
+        this.tokens.set(sessionId, token);
       }
 
       logger.info('Tokens loaded from file', {
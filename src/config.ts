@@ -113,6 +113,7 @@ function loadConfig() {
   return result.data;
 }
 
-export const config = loadConfig();
-
 export type Config = z.infer<typeof ConfigSchema>;
+
+// Frozen: configuration is read on hot paths and must never change at runtime
+export const config: Readonly<Config> = Object.freeze(loadConfig());
@@ -1,21 +1,53 @@
-import { Pool, PoolClient } from 'pg';
+import type { Pool, PoolClient } from 'pg';
 import { readFileSync } from 'fs';
 import { join, dirname } from 'path';
 import { fileURLToPath } from 'url';
 import { config } from '../config.js';
+import { createLogger } from '../utils/logger.js';
+
+// Logs go through winston (stderr) so they never interleave with the
+// JSON-RPC stream on stdout when running under the stdio transport
+const logger = createLogger('database');
 
 // ES module __dirname equivalent
 const __filename = fileURLToPath(import.meta.url);
 const __dirname = dirname(__filename);
 
-// Create connection pool (will be null if no DATABASE_URL configured)
+// Connection pool, created on first use (stays null if no DATABASE_URL configured)
 let pool: Pool | null = null;
+let poolPromise: Promise<Pool> | null = null;
+
+if (!config.databaseUrl) {
+  logger.warn('DATABASE_URL not configured - adaptive playlists will not be available');
+}
+
+/**
+ * Get the connection pool, creating it on first use.
+ * pg is only loaded once a database is actually needed, which keeps it off
+ * the cold-start path for stdio/Smithery sessions that never touch it.
+ */
+function getPool(): Promise<Pool> {
+  const connectionString = config.databaseUrl;
+  if (!connectionString) {
+    throw new Error('Database not configured - DATABASE_URL is missing');
+  }
+  // Concurrent first queries share one pool creation; a failed attempt
+  // is forgotten so the next query can retry instead of failing forever
+  if (!poolPromise) {
+    poolPromise = createPool(connectionString).catch((error) => {
+      poolPromise = null;
+      throw error;
+    });
+  }
+  return poolPromise;
+}
 
-if (config.databaseUrl) {
+async function createPool(connectionString: string): Promise<Pool> {
+  const pg = await import('pg');
   const isProduction = config.nodeEnv === 'production';
 
-  pool = new Pool({
-    connectionString: config.databaseUrl,
+  const newPool = new pg.Pool({
+    connectionString,
     ssl: isProduction ? { rejectUnauthorized: false } : false,
 
     // Pool settings
@@ -31,55 +63,58 @@ if (config.databaseUrl) {
 
     application_name: 'youtube-music-mcp'
   });
-} else {
-  console.warn('⚠️  DATABASE_URL not configured - adaptive playlists will not be available');
-}
 
-// Event handlers
-if (pool) {
-  pool.on('connect', () => {
-    console.log('🔌 New database connection established');
+  // Event handlers
+  // The pool only grows when a connection is opened, so check capacity
+  // there rather than on every checkout; 'acquire' fires for every query
+  // and only needs to watch the wait queue
+  const nearCapacity = config.databasePoolMax * 0.8;
+
+  newPool.on('connect', () => {
+    logger.debug('New database connection established');
+
+    const activeConnections = newPool.totalCount;
+    if (activeConnections > nearCapacity) {
+      logger.warn('Connection pool near capacity', {
+        activeConnections,
+        maxConnections: config.databasePoolMax,
+      });
+    }
   });
 
-  pool.on('acquire', () => {
-    if (!pool) return;
-    const activeConnections = pool.totalCount;
-    const waitingClients = pool.waitingCount;
-
+  newPool.on('acquire', () => {
+    const waitingClients = newPool.waitingCount;
     if (waitingClients > 5) {
-      console.warn(`⚠️  High connection wait queue: ${waitingClients} clients waiting`);
-    }
-
-    if (activeConnections > config.databasePoolMax * 0.8) {
-      console.warn(`⚠️  Connection pool near capacity: ${activeConnections}/${config.databasePoolMax}`);
+      logger.warn('High connection wait queue', { waitingClients });
     }
   });
 
-  pool.on('error', (err) => {
-    console.error('❌ Unexpected database error:', err);
+  newPool.on('error', (err) => {
+    logger.error('Unexpected database error', { error: err.message });
   });
 
   // Graceful shutdown
   process.on('SIGTERM', async () => {
-    console.log('🔄 Draining database connection pool...');
-    if (pool) {
-      await pool.end();
-    }
+    logger.info('Draining database connection pool');
+    await newPool.end();
     process.exit(0);
   });
+
+  pool = newPool;
+  return newPool;
 }
 
 // Initialize database (run migrations)
 export async function initializeDatabase(): Promise<void> {
-  if (!pool) {
-    console.log('⏭️  Skipping database initialization - no DATABASE_URL configured');
+  if (!config.databaseUrl) {
+    logger.info('Skipping database initialization - no DATABASE_URL configured');
     return;
   }
 
   try {
-    console.log('🔄 Initializing database...');
+    logger.info('Initializing database');
 
-    const client = await pool.connect();
+    const client = await (await getPool()).connect();
 
     try {
       // Read schema file
@@ -89,17 +124,19 @@ export async function initializeDatabase(): Promise<void> {
       // Execute schema
       await client.query(schemaSql);
 
-      console.log('✅ Database schema initialized');
+      logger.info('Database schema initialized');
     } finally {
       client.release();
     }
   } catch (error) {
-    console.error('❌ Database initialization failed:', error);
+    logger.error('Database initialization failed', {
+      error: error instanceof Error ? error.message : 'Unknown error',
+    });
     throw error;
   }
 }
 
-// Health check
+// Health check (reports no connections until the pool is first used)
 export async function checkDatabaseHealth(): Promise<{
   healthy: boolean;
   totalConnections: number;
@@ -127,32 +164,33 @@ export async function checkDatabaseHealth(): Promise<{
 export const db = {
   // eslint-disable-next-line @typescript-eslint/no-explicit-any
   query: async (text: string, params?: any[]) => {
-    if (!pool) {
-      throw new Error('Database not configured - DATABASE_URL is missing');
-    }
+    // Once the pool exists, use it directly instead of awaiting getPool()
+    const activePool = pool ?? await getPool();
 
     const start = Date.now();
     try {
-      const result = await pool.query(text, params);
+      const result = await activePool.query(text, params);
       const duration = Date.now() - start;
 
       // Log slow queries
       if (duration > 1000) {
-        console.warn(`🐌 Slow query (${duration}ms):`, text.substring(0, 100));
+        logger.warn('Slow query', { durationMs: duration, query: text.substring(0, 100) });
       }
 
       return result;
     } catch (error) {
-      console.error('❌ Query error:', error);
+      logger.error('Query error', {
+        error: error instanceof Error ? error.message : 'Unknown error',
+      });
       throw error;
     }
   },
 
   getClient: (): Promise<PoolClient> => {
-    if (!pool) {
-      throw new Error('Database not configured - DATABASE_URL is missing');
+    if (pool) {
+      return pool.connect();
     }
-    return pool.connect();
+    return getPool().then((activePool) => activePool.connect());
   }
 };
 
@@ -4,6 +4,7 @@
  */
 import { McpServer } from '@modelcontextprotocol/sdk/server/mcp.js';
 import { StdioServerTransport } from '@modelcontextprotocol/sdk/server/stdio.js';
+import { pathToFileURL } from 'url';
 import { z } from 'zod';
 import { registerQueryTools } from './tools/query.js';
 import { registerPlaylistTools } from './tools/playlist.js';
@@ -40,29 +41,41 @@ export type Config = z.infer<typeof configSchema>;
 // Export OAuth provider for Smithery OAuth integration
 export { oauth };
 
+type SharedClients = Omit<ServerContext, 'sessions' | 'db'>;
+
+let sharedClients: SharedClients | null = null;
+
+/**
+ * API clients are stateless per user (auth comes from the token store), so
+ * build them once and share them across every server Smithery creates.
+ * This also keeps a single MusicBrainz rate limiter and Spotify app token.
+ */
+function getSharedClients(): SharedClients {
+  if (!sharedClients) {
+    const ytMusic = new YouTubeMusicClient();
+    const musicBrainz = new MusicBrainzClient();
+    const listenBrainz = new ListenBrainzClient();
+    sharedClients = {
+      ytMusic,
+      ytData: new YouTubeDataClient(ytMusic),
+      musicBrainz,
+      listenBrainz,
+      recommendations: new RecommendationEngine(musicBrainz, listenBrainz, ytMusic),
+      spotify: new SpotifyClient(),
+      reccobeats: new ReccoBeatsClient(),
+    };
+  }
+  return sharedClients;
+}
+
 /**
  * Creates and returns the MCP server instance.
  * Called by Smithery runtime — do NOT start an HTTP server here.
  */
 export default function createServer(config?: Config) {
-  const ytMusic = new YouTubeMusicClient();
-  const ytData = new YouTubeDataClient(ytMusic);
-  const musicBrainz = new MusicBrainzClient();
-  const listenBrainz = new ListenBrainzClient();
-  const spotify = new SpotifyClient();
-  const reccobeats = new ReccoBeatsClient();
-  const sessions = new SessionManager();
-  const recommendations = new RecommendationEngine(musicBrainz, listenBrainz, ytMusic);
-
   const context: ServerContext = {
-    ytMusic,
-    ytData,
-    musicBrainz,
-    listenBrainz,
-    recommendations,
-    sessions,
-    spotify,
-    reccobeats,
+    ...getSharedClients(),
+    sessions: new SessionManager(),
     db,
   };
 
@@ -82,8 +95,11 @@ export default function createServer(config?: Config) {
   return server;
 }
 
-// CLI entry point — used when run directly (e.g. local testing)
-if (import.meta.url === `file://${process.argv[1]}`) {
+// CLI entry point — used when run directly (e.g. local testing).
+// Compare proper file URLs: hand-built `file://` strings miss paths that
+// need percent-encoding (spaces, non-ASCII) and Windows drive letters.
+const entryPath = process.argv[1];
+if (entryPath && import.meta.url === pathToFileURL(entryPath).href) {
   const server = createServer();
   const transport = new StdioServerTransport();
   server.connect(transport).catch((err) => {
@@ -1,5 +1,6 @@
 import got, { Got } from 'got';
 import { createLogger } from '../utils/logger.js';
+import { httpAgent } from '../utils/http-agent.js';
 import type { LBSimilarArtist, LBRecording } from '../types/index.js';
 
 const logger = createLogger('listenbrainz-client');
@@ -17,6 +18,7 @@ export class ListenBrainzClient {
     this.userToken = userToken;
 
     this.client = got.extend({
+      agent: httpAgent,
       timeout: {
         request: 30000,
       },
@@ -1,5 +1,7 @@
 import got, { Got } from 'got';
 import { createLogger } from '../utils/logger.js';
+import { httpAgent } from '../utils/http-agent.js';
+import { jitteredRetryDelay, TRANSIENT_STATUS_CODES } from '../utils/retry.js';
 
 const logger = createLogger('reccobeats-client');
 
@@ -54,6 +56,7 @@ export class ReccoBeatsClient {
 
   constructor() {
     this.client = got.extend({
+      agent: httpAgent,
       prefixUrl: 'https://api.reccobeats.com/v1',
       headers: {
         'User-Agent': 'YouTubeMusicMCPServer/3.0.0',
@@ -64,7 +67,8 @@ export class ReccoBeatsClient {
       retry: {
         limit: 3,
         methods: ['GET'],
-        statusCodes: [429, 500, 502, 503, 504],
+        statusCodes: TRANSIENT_STATUS_CODES,
+        calculateDelay: jitteredRetryDelay,
       },
       responseType: 'json',
     });
@@ -176,10 +180,13 @@ export class ReccoBeatsClient {
       }
     }
 
-    logger.debug('Retrieved multiple ReccoBeats audio features', {
-      requested: spotifyIds.length,
-      received: results.filter((f) => f !== null).length,
-    });
+    // Counting hits walks every result, so only do it when debug is on
+    if (logger.isDebugEnabled()) {
+      logger.debug('Retrieved multiple ReccoBeats audio features', {
+        requested: spotifyIds.length,
+        received: results.filter((f) => f !== null).length,
+      });
+    }
 
     return results;
   }
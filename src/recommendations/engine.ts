@@ -2,10 +2,14 @@ import { createLogger } from '../utils/logger.js';
 import { MusicBrainzClient } from '../musicbrainz/client.js';
 import { ListenBrainzClient } from '../listenbrainz/client.js';
 import { YouTubeMusicClient } from '../youtube-music/client.js';
+import { mapWithConcurrency } from '../utils/concurrency.js';
 import type { MBArtist, MBRecording, Song, LBRecording } from '../types/index.js';
 
 const logger = createLogger('recommendation-engine');
 
+// Max concurrent YouTube Music searches when resolving recommendations
+const YTM_SEARCH_CONCURRENCY = 4;
+
 export interface RecommendationOptions {
   excludeArtists?: string[];
   preferTags?: string[];
@@ -122,9 +126,9 @@ export class RecommendationEngine {
 
     // Filter excluded artists
     if (excludeArtists.length > 0) {
-      const excludeLower = excludeArtists.map((a) => a.toLowerCase());
+      const excludeLower = new Set(excludeArtists.map((a) => a.toLowerCase()));
       recordings = recordings.filter(
-        (rec) => !excludeLower.includes(rec.creator.toLowerCase())
+        (rec) => !excludeLower.has(rec.creator.toLowerCase())
       );
     }
 
@@ -148,6 +152,9 @@ export class RecommendationEngine {
     // In a full implementation, we'd look up each recording's tags
 
     const scored: Array<{ rec: LBRecording; score: number }> = [];
+    // Lowercase the preferences once, not once per recording
+    const preferLower = preferTags.map((t) => t.toLowerCase());
+    const avoidLower = avoidTags.map((t) => t.toLowerCase());
 
     for (const rec of recordings) {
       let score = 0;
@@ -157,16 +164,16 @@ export class RecommendationEngine {
         const artists = await this.mbClient.searchArtist(rec.creator, 1);
         if (artists.length > 0 && artists[0]) {
           const tags = await this.mbClient.getArtistTags(artists[0].mbid);
-          const tagNames = tags.map((t) => t.name.toLowerCase());
+          const tagNames = new Set(tags.map((t) => t.name.toLowerCase()));
 
-          for (const tag of preferTags) {
-            if (tagNames.includes(tag.toLowerCase())) {
+          for (const tag of preferLower) {
+            if (tagNames.has(tag)) {
               score += 1;
             }
           }
 
-          for (const tag of avoidTags) {
-            if (tagNames.includes(tag.toLowerCase())) {
+          for (const tag of avoidLower) {
+            if (tagNames.has(tag)) {
               score -= 2;
             }
           }
@@ -194,44 +201,49 @@ export class RecommendationEngine {
       count: recordings.length,
     });
 
-    const songs: Song[] = [];
-    const notFound: Array<{ title: string; artist: string }> = [];
-
-    for (const rec of recordings) {
-      const query = `${rec.title} ${rec.creator}`;
-
-      try {
-        const searchResult = await this.ytClient.search(query, {
-          filter: 'songs',
-          limit: 1,
-        });
+    // Searches are independent, so overlap them instead of paying one
+    // round-trip per recording back to back
+    const matches = await mapWithConcurrency(
+      recordings,
+      YTM_SEARCH_CONCURRENCY,
+      async (rec): Promise<Song | null> => {
+        const query = `${rec.title} ${rec.creator}`;
+
+        try {
+          const searchResult = await this.ytClient.search(query, {
+            filter: 'songs',
+            limit: 1,
+          });
 
-        if (searchResult.songs && searchResult.songs.length > 0) {
-          const song = searchResult.songs[0];
-          if (song) {
-            songs.push({
-              ...song,
-              // Mark as recommendation source
-            });
-          }
-        } else {
-          notFound.push({
+          const song = searchResult.songs?.[0];
+          return song ? { ...song } : null;
+        } catch (error) {
+          logger.warn('Track search failed', {
             title: rec.title,
             artist: rec.creator,
+            error,
           });
+          return null;
         }
-      } catch (error) {
-        logger.warn('Track search failed', {
-          title: rec.title,
-          artist: rec.creator,
-          error,
-        });
+      }
+    );
+
+    const songs: Song[] = [];
+    const notFound: Array<{ title: string; artist: string }> = [];
+
+    matches.forEach((song, index) => {
+      if (song) {
+        songs.push(song);
+        return;
+      }
+      const rec = recordings[index];
+      if (rec) {
         notFound.push({
           title: rec.title,
           artist: rec.creator,
         });
       }
-    }
+    });
 
     logger.info('YouTube Music search complete', {
       found: songs.length,
@@ -6,6 +6,9 @@ const logger = createLogger('session-manager');
 
 export class SessionManager {
   private sessions: Map<string, PlaylistSession> = new Map();
+  // Expiry as epoch ms per session, so TTL checks compare integers instead
+  // of re-parsing the ISO createdAt string on every lookup
+  private expiresAt: Map<string, number> = new Map();
   private sessionTtl: number = 3600000; // 1 hour in milliseconds
 
   constructor(ttlSeconds: number = 3600) {
@@ -18,7 +21,8 @@ export class SessionManager {
    */
   createSession(mode: 'discover' | 'from_library' | 'mixed' = 'discover'): PlaylistSession {
     const sessionId = uuidv4();
-    const now = new Date().toISOString();
+    const nowMs = Date.now();
+    const now = new Date(nowMs).toISOString();
 
     const session: PlaylistSession = {
       sessionId,
@@ -35,6 +39,7 @@ export class SessionManager {
     };
 
     this.sessions.set(sessionId, session);
+    this.expiresAt.set(sessionId, nowMs + this.sessionTtl);
 
     logger.info('Session created', { sessionId, mode });
 
@@ -56,9 +61,9 @@ export class SessionManager {
     }
 
     // Check if expired
-    const createdAt = new Date(session.createdAt).getTime();
-    if (Date.now() - createdAt > this.sessionTtl) {
+    if (this.isExpired(sessionId, Date.now())) {
       this.sessions.delete(sessionId);
+      this.expiresAt.delete(sessionId);
       logger.debug('Session expired', { sessionId });
       return undefined;
     }
@@ -172,6 +177,7 @@ export class SessionManager {
    */
   deleteSession(sessionId: string): void {
     this.sessions.delete(sessionId);
+    this.expiresAt.delete(sessionId);
     logger.debug('Session deleted', { sessionId });
   }
 
@@ -182,9 +188,8 @@ export class SessionManager {
     const now = Date.now();
     const active: PlaylistSession[] = [];
 
-    for (const session of this.sessions.values()) {
-      const createdAt = new Date(session.createdAt).getTime();
-      if (now - createdAt <= this.sessionTtl) {
+    for (const [sessionId, session] of this.sessions) {
+      if (!this.isExpired(sessionId, now)) {
         active.push(session);
       }
     }
@@ -192,20 +197,22 @@ export class SessionManager {
     return active;
   }
 
+  /**
+   * Check whether a session has outlived the TTL
+   */
+  private isExpired(sessionId: string, now: number): boolean {
+    return now > (this.expiresAt.get(sessionId) ?? 0);
+  }
+
   /**
    * Schedule session cleanup after TTL
    */
   private scheduleCleanup(sessionId: string): void {
     setTimeout(() => {
-      if (this.sessions.has(sessionId)) {
-        const session = this.sessions.get(sessionId);
-        if (session) {
-          const createdAt = new Date(session.createdAt).getTime();
-          if (Date.now() - createdAt > this.sessionTtl) {
-            this.sessions.delete(sessionId);
-            logger.debug('Session cleaned up', { sessionId });
-          }
-        }
+      if (this.sessions.has(sessionId) && this.isExpired(sessionId, Date.now())) {
+        this.sessions.delete(sessionId);
+        this.expiresAt.delete(sessionId);
+        logger.debug('Session cleaned up', { sessionId });
       }
     }, this.sessionTtl + 1000);
   }
@@ -24,10 +24,65 @@ import { RecommendationEngine } from './recommendations/engine.js';
 import { SessionManager } from './recommendations/session.js';
 import { oauth } from './auth/smithery-oauth-provider.js';
 import { tokenStore } from './auth/token-store.js';
+import { bindSessionToken } from './auth/session-binding.js';
 import { db, initializeDatabase, checkDatabaseHealth } from './database/client.js';
 
 const logger = createLogger('server');
 
+// Keep idle client connections open longer than typical reverse-proxy
+// idle timeouts (Railway, Smithery, ngrok) so sockets get reused instead
+// of being reset between MCP requests
+const KEEP_ALIVE_TIMEOUT_MS = 65000;
+const HEADERS_TIMEOUT_MS = KEEP_ALIVE_TIMEOUT_MS + 1000;
+
+// Our encoded OAuth state (client state, redirect URI, client ID, PKCE
+// challenge) stays well under this; anything longer is rejected before
+// it is decoded
+const MAX_OAUTH_STATE_LENGTH = 8192;
+
+// Fixed JSON-RPC error bodies, serialized once and sent as-is. Clients
+// that outlive a server restart hit the missing-session error on every
+// retry until they re-initialize.
+const NO_SESSION_ERROR_JSON = JSON.stringify({
+  jsonrpc: '2.0',
+  error: {
+    code: -32000,
+    message: 'Bad Request: No valid session ID provided',
+  },
+  id: null,
+});
+const INTERNAL_ERROR_JSON = JSON.stringify({
+  jsonrpc: '2.0',
+  error: {
+    code: -32603,
+    message: 'Internal server error',
+  },
+  id: null,
+});
+
+/**
+ * Derive the server's base URL from the redirect URI by removing the
+ * /oauth/callback path; mcpAuthRouter expects the base URL, not the full
+ * callback URL
+ */
+function deriveBaseUrl(): URL {
+  if (!config.googleRedirectUri) {
+    return new URL(`http://localhost:${config.port}`);
+  }
+  const redirectUrl = new URL(config.googleRedirectUri);
+  const basePath = redirectUrl.pathname.replace(/\/oauth\/callback$/, '');
+  return new URL(basePath || '/', redirectUrl.origin);
+}
+
+// OAuth endpoint URLs depend only on frozen config, so resolve them once per
+// process rather than on every server build
+const OAUTH_BASE_URL = deriveBaseUrl();
+// Resource server URL (where the MCP server is hosted)
+const MCP_RESOURCE_URL = new URL('/mcp', OAUTH_BASE_URL);
+// Protected Resource Metadata URL advertised in 401 responses
+const MCP_RESOURCE_METADATA_URL = getOAuthProtectedResourceMetadataUrl(MCP_RESOURCE_URL);
+const SERVICE_DOCUMENTATION_URL = new URL('https://github.com/CaullenOmdahl/youtube-music-mcp-server');
+
 export interface ServerContext {
   ytMusic: YouTubeMusicClient;
   ytData: YouTubeDataClient;
@@ -95,7 +150,15 @@ export async function createServer(): Promise<Server> {
   // Trust proxy for proper IP detection behind reverse proxies (ngrok, Smithery, etc.)
   app.set('trust proxy', 1);
 
-  app.use(express.json());
+  // MCP responses are never conditionally re-fetched, so skip hashing every
+  // response body for an ETag and drop the framework banner header
+  app.set('etag', false);
+  app.disable('x-powered-by');
+
+  // JSON bodies are only parsed on the MCP message routes, after bearer auth
+  // has run, so rejected requests and the OAuth routes (which bring their
+  // own parsers) never pay for it
+  const jsonBody = express.json();
 
   // Health check endpoint
   app.get('/health', async (_req: Request, res: Response) => {
@@ -108,126 +171,33 @@ export async function createServer(): Promise<Server> {
     });
   });
 
-  // Mount OAuth routes using MCP SDK's mcpAuthRouter for local testing
-  // In production, Smithery handles these automatically
-
-  // Derive base URL from redirect URI by removing /oauth/callback path
-  // mcpAuthRouter expects the server's base URL, not the full callback URL
-  let baseUrl: URL;
-  if (config.googleRedirectUri) {
-    const redirectUrl = new URL(config.googleRedirectUri);
-    // Remove /oauth/callback to get the base server URL
-    const basePath = redirectUrl.pathname.replace(/\/oauth\/callback$/, '');
-    baseUrl = new URL(basePath || '/', redirectUrl.origin);
-  } else {
-    baseUrl = new URL(`http://localhost:${config.port}`);
-  }
-
-  logger.info('OAuth router base URL', { baseUrl: baseUrl.toString() });
-
-  // Rate limit config that works behind proxies
-  const rateLimitConfig = {
-    validate: { xForwardedForHeader: false }
-  };
-
-  // Resource server URL (where the MCP server is hosted)
-  const resourceServerUrl = new URL('/mcp', baseUrl);
-
-  app.use(
-    mcpAuthRouter({
-      provider: oauth,
-      issuerUrl: baseUrl, // Our server is the OAuth issuer (proxies to Google)
-      baseUrl,
-      resourceServerUrl, // Tell the router where the protected MCP endpoints are
-      serviceDocumentationUrl: new URL('https://github.com/CaullenOmdahl/youtube-music-mcp-server'),
-      // Configure rate limiting to work behind reverse proxies
-      authorizationOptions: { rateLimit: rateLimitConfig },
-      tokenOptions: { rateLimit: rateLimitConfig },
-      clientRegistrationOptions: { rateLimit: rateLimitConfig },
-      revocationOptions: { rateLimit: rateLimitConfig },
-    })
-  );
-
-  logger.info('OAuth routes mounted for local testing');
-
-  // OAuth callback handler for Google redirects
-  // When Google redirects back, we need to extract the stored client info and continue the flow
-  app.get('/oauth/callback', async (req: Request, res: Response) => {
-    try {
-      const { code, state } = req.query;
-
-      if (!code || !state) {
-        res.status(400).send('Missing code or state parameter');
-        return;
-      }
-
-      // Decode the state to get client info
-      const stateData = JSON.parse(Buffer.from(state as string, 'base64url').toString());
-      const { clientId, clientRedirectUri, original: originalState } = stateData;
-
-      // Redirect to the client's callback with the code and original state
-      const redirectUrl = new URL(clientRedirectUri);
-      redirectUrl.searchParams.set('code', code as string);
-      if (originalState) {
-        redirectUrl.searchParams.set('state', originalState);
-      }
-
-      logger.info('OAuth callback - redirecting to client', {
-        clientId,
-        clientRedirectUri,
-      });
-
-      res.redirect(redirectUrl.toString());
-    } catch (error) {
-      logger.error('OAuth callback failed', { error });
-      res.status(500).send('OAuth callback processing failed');
-    }
-  });
-
-  // Protected Resource Metadata URL for OAuth 2.0
-  const resourceMetadataUrl = getOAuthProtectedResourceMetadataUrl(resourceServerUrl);
-
   // Apply bearer auth middleware to MCP endpoints (unless bypassing for testing)
   if (!config.bypassAuth) {
     app.use('/mcp', requireBearerAuth({
       verifier: oauth,
       requiredScopes: [],
-      resourceMetadataUrl,
+      resourceMetadataUrl: MCP_RESOURCE_METADATA_URL,
     }));
     logger.info('Bearer auth required for MCP endpoints');
 
-    // Extract and store authenticated token for YouTube Music API calls
-    app.use('/mcp', (req: Request, _res: Response, next) => {
-      const authHeader = req.headers.authorization;
-      if (authHeader?.startsWith('Bearer ')) {
-        const token = authHeader.substring(7);
-        // Store token with MCP session ID
-        const sessionId = req.headers['mcp-session-id'] as string | undefined;
-        if (sessionId) {
-          // Note: We don't have refresh token or expiry from the bearer token itself
-          // The OAuth provider handles token refresh
-          tokenStore.setToken(sessionId, {
-            accessToken: token,
-            refreshToken: '', // Not available from bearer auth
-            expiresAt: Date.now() + 3600000, // Assume 1 hour
-          });
-          tokenStore.setCurrentSession(sessionId);
-          logger.debug('Token stored for YouTube Music API calls', { sessionId });
-        }
-      }
-      next();
-    });
+    // Parse the body before binding the session: body-parser resumes from
+    // socket events, which would drop the request's AsyncLocalStorage context
+    app.use('/mcp', jsonBody);
+
+    // Store the authenticated token for YouTube Music API calls and bind
+    // the MCP session to the rest of the request
+    app.use('/mcp', bindSessionToken);
   } else {
     logger.warn('BYPASS_AUTH enabled - MCP endpoints unprotected!');
+    app.use('/mcp', jsonBody);
   }
 
   // Store transports for session management
-  const transports: {
-    streamable: Record<string, StreamableHTTPServerTransport>;
-    sse: Record<string, SSEServerTransport>;
-  } = {
-    streamable: {},
-    sse: {},
+  // Maps rather than plain objects: keys come from client headers, churn
+  // constantly, and must never resolve to Object.prototype members
+  const transports = {
+    streamable: new Map<string, StreamableHTTPServerTransport>(),
+    sse: new Map<string, SSEServerTransport>(),
   };
 
   // Modern Streamable HTTP endpoint for MCP protocol
@@ -235,16 +205,17 @@ export async function createServer(): Promise<Server> {
     try {
       const sessionId = req.headers['mcp-session-id'] as string | undefined;
       let transport: StreamableHTTPServerTransport;
+      const existing = sessionId ? transports.streamable.get(sessionId) : undefined;
 
-      if (sessionId && transports.streamable[sessionId]) {
+      if (existing) {
         // Reuse existing transport
-        transport = transports.streamable[sessionId];
+        transport = existing;
       } else if (!sessionId && isInitializeRequest(req.body)) {
         // New initialization request
         transport = new StreamableHTTPServerTransport({
           sessionIdGenerator: () => randomUUID(),
           onsessioninitialized: (newSessionId: string) => {
-            transports.streamable[newSessionId] = transport;
+            transports.streamable.set(newSessionId, transport);
             logger.info('MCP session initialized', { sessionId: newSessionId });
           },
         });
@@ -252,7 +223,8 @@ export async function createServer(): Promise<Server> {
         // Clean up transport when closed
         transport.onclose = () => {
           if (transport.sessionId) {
-            delete transports.streamable[transport.sessionId];
+            transports.streamable.delete(transport.sessionId);
+            tokenStore.removeToken(transport.sessionId);
             logger.info('MCP session closed', { sessionId: transport.sessionId });
           }
         };
@@ -261,14 +233,7 @@ export async function createServer(): Promise<Server> {
         await mcpServer.connect(transport);
       } else {
         // Invalid request
-        res.status(400).json({
-          jsonrpc: '2.0',
-          error: {
-            code: -32000,
-            message: 'Bad Request: No valid session ID provided',
-          },
-          id: null,
-        });
+        res.status(400).type('json').send(NO_SESSION_ERROR_JSON);
         return;
       }
 
@@ -277,14 +242,7 @@ export async function createServer(): Promise<Server> {
     } catch (error) {
       logger.error('MCP request failed', { error });
       if (!res.headersSent) {
-        res.status(500).json({
-          jsonrpc: '2.0',
-          error: {
-            code: -32603,
-            message: 'Internal server error',
-          },
-          id: null,
-        });
+        res.status(500).type('json').send(INTERNAL_ERROR_JSON);
       }
     }
   });
@@ -292,24 +250,24 @@ export async function createServer(): Promise<Server> {
   // Handle GET requests for server-to-client notifications via SSE
   app.get('/mcp', async (req: Request, res: Response) => {
     const sessionId = req.headers['mcp-session-id'] as string | undefined;
-    if (!sessionId || !transports.streamable[sessionId]) {
+    const transport = sessionId ? transports.streamable.get(sessionId) : undefined;
+    if (!transport) {
       res.status(400).send('Invalid or missing session ID');
       return;
     }
 
-    const transport = transports.streamable[sessionId];
     await transport.handleRequest(req, res);
   });
 
   // Handle DELETE requests for session termination
   app.delete('/mcp', async (req: Request, res: Response) => {
     const sessionId = req.headers['mcp-session-id'] as string | undefined;
-    if (!sessionId || !transports.streamable[sessionId]) {
+    const transport = sessionId ? transports.streamable.get(sessionId) : undefined;
+    if (!transport) {
       res.status(400).send('Invalid or missing session ID');
       return;
     }
 
-    const transport = transports.streamable[sessionId];
     await transport.handleRequest(req, res);
   });
 
@@ -318,19 +276,21 @@ export async function createServer(): Promise<Server> {
     app.use(['/sse', '/messages'], requireBearerAuth({
       verifier: oauth,
       requiredScopes: [],
-      resourceMetadataUrl,
+      resourceMetadataUrl: MCP_RESOURCE_METADATA_URL,
     }));
     logger.info('Bearer auth required for legacy SSE endpoints');
   }
 
+  app.use('/messages', jsonBody);
+
   // Legacy SSE endpoint for older clients
   app.get('/sse', async (req: Request, res: Response) => {
     logger.info('SSE connection initiated (legacy transport)');
     const transport = new SSEServerTransport('/messages', res);
-    transports.sse[transport.sessionId] = transport;
+    transports.sse.set(transport.sessionId, transport);
 
     res.on('close', () => {
-      delete transports.sse[transport.sessionId];
+      transports.sse.delete(transport.sessionId);
       logger.info('SSE connection closed', { sessionId: transport.sessionId });
     });
 
@@ -340,7 +300,7 @@ export async function createServer(): Promise<Server> {
   // Legacy message endpoint for older clients
   app.post('/messages', async (req: Request, res: Response) => {
     const sessionId = req.query.sessionId as string;
-    const transport = transports.sse[sessionId];
+    const transport = transports.sse.get(sessionId);
     if (transport) {
       await transport.handlePostMessage(req, res, req.body);
     } else {
@@ -348,6 +308,74 @@ export async function createServer(): Promise<Server> {
     }
   });
 
+  // Mount OAuth routes using MCP SDK's mcpAuthRouter for local testing
+  // In production, Smithery handles these automatically
+  // Registered after the MCP routes: the router's paths never overlap them,
+  // and MCP traffic shouldn't be matched against every OAuth route first
+
+  logger.info('OAuth router base URL', { baseUrl: OAUTH_BASE_URL.href });
+
+  // Rate limit config that works behind proxies
+  const rateLimitConfig = {
+    validate: { xForwardedForHeader: false }
+  };
+
+  app.use(
+    mcpAuthRouter({
+      provider: oauth,
+      issuerUrl: OAUTH_BASE_URL, // Our server is the OAuth issuer (proxies to Google)
+      baseUrl: OAUTH_BASE_URL,
+      resourceServerUrl: MCP_RESOURCE_URL, // Tell the router where the protected MCP endpoints are
+      serviceDocumentationUrl: SERVICE_DOCUMENTATION_URL,
+      // Configure rate limiting to work behind reverse proxies
+      authorizationOptions: { rateLimit: rateLimitConfig },
+      tokenOptions: { rateLimit: rateLimitConfig },
+      clientRegistrationOptions: { rateLimit: rateLimitConfig },
+      revocationOptions: { rateLimit: rateLimitConfig },
+    })
+  );
+
+  logger.info('OAuth routes mounted for local testing');
+
+  // OAuth callback handler for Google redirects
+  // When Google redirects back, we need to extract the stored client info and continue the flow
+  app.get('/oauth/callback', async (req: Request, res: Response) => {
+    try {
+      const { code, state } = req.query;
+
+      if (typeof code !== 'string' || typeof state !== 'string' || !code || !state) {
+        res.status(400).send('Missing code or state parameter');
+        return;
+      }
+
+      if (state.length > MAX_OAUTH_STATE_LENGTH) {
+        res.status(400).send('Invalid state parameter');
+        return;
+      }
+
+      // Decode the state to get client info
+      const stateData = JSON.parse(Buffer.from(state, 'base64url').toString());
+      const { clientId, clientRedirectUri, original: originalState } = stateData;
+
+      // Redirect to the client's callback with the code and original state
+      const redirectUrl = new URL(clientRedirectUri);
+      redirectUrl.searchParams.set('code', code);
+      if (originalState) {
+        redirectUrl.searchParams.set('state', originalState);
+      }
+
+      logger.info('OAuth callback - redirecting to client', {
+        clientId,
+        clientRedirectUri,
+      });
+
+      res.redirect(redirectUrl.toString());
+    } catch (error) {
+      logger.error('OAuth callback failed', { error });
+      res.status(500).send('OAuth callback processing failed');
+    }
+  });
+
   let httpServer: ReturnType<typeof app.listen> | null = null;
 
   return {
@@ -362,23 +390,19 @@ export async function createServer(): Promise<Server> {
         logger.info(`Health endpoint: http://localhost:${config.port}/health`);
         logger.info('OAuth routes: Managed by Smithery');
       });
+      httpServer.keepAliveTimeout = KEEP_ALIVE_TIMEOUT_MS;
+      httpServer.headersTimeout = HEADERS_TIMEOUT_MS;
     },
 
     async close() {
       logger.info('Shutting down server...');
 
       // Close all active transports
-      for (const sessionId of Object.keys(transports.streamable)) {
-        const transport = transports.streamable[sessionId];
-        if (transport) {
-          transport.close();
-        }
+      for (const transport of transports.streamable.values()) {
+        transport.close();
       }
-      for (const sessionId of Object.keys(transports.sse)) {
-        const transport = transports.sse[sessionId];
-        if (transport) {
-          transport.close();
-        }
+      for (const transport of transports.sse.values()) {
+        transport.close();
       }
 
       if (httpServer) {
@@ -392,12 +416,23 @@ export async function createServer(): Promise<Server> {
         });
       }
 
-      // Close clients
-      await ytMusic.close();
-      await ytData.close();
-      await musicBrainz.close();
-      await listenBrainz.close();
-      await spotify.close();
+      // Close clients and persist pending token changes; none depend on
+      // each other, so don't wait on them one at a time
+      const results = await Promise.allSettled([
+        ytMusic.close(),
+        ytData.close(),
+        musicBrainz.close(),
+        listenBrainz.close(),
+        spotify.close(),
+        tokenStore.flush(),
+      ]);
+      for (const result of results) {
+        if (result.status === 'rejected') {
+          logger.error('Shutdown step failed', {
+            error: result.reason instanceof Error ? result.reason.message : 'Unknown error',
+          });
+        }
+      }
 
       logger.info('Server shutdown complete');
     },
@@ -1,9 +1,26 @@
 import got, { Got } from 'got';
 import { config } from '../config.js';
 import { createLogger } from '../utils/logger.js';
+import { httpAgent } from '../utils/http-agent.js';
+import { jitteredRetryDelay, TRANSIENT_STATUS_CODES } from '../utils/retry.js';
 
 const logger = createLogger('spotify-client');
 
+const SPOTIFY_TOKEN_URL = 'https://accounts.spotify.com/api/token';
+// Client credentials never change at runtime, so encode them once
+const SPOTIFY_BASIC_AUTH = `Basic ${Buffer.from(
+  `${config.spotifyClientId}:${config.spotifyClientSecret}`
+).toString('base64')}`;
+// The client-credentials grant never varies, so the whole request is fixed
+const SPOTIFY_TOKEN_HEADERS = {
+  Authorization: SPOTIFY_BASIC_AUTH,
+  'Content-Type': 'application/x-www-form-urlencoded',
+};
+const SPOTIFY_TOKEN_BODY = 'grant_type=client_credentials';
+// After a failed token request, fail fast for this long instead of making
+// every feature lookup pay for another doomed round-trip
+const TOKEN_FAILURE_BACKOFF_MS = 5 * 60 * 1000;
+
 /**
  * Spotify Audio Features
  * https://developer.spotify.com/documentation/web-api/reference/get-audio-features
@@ -53,9 +70,12 @@ export class SpotifyClient {
   private client: Got;
   private accessToken: string | null = null;
   private tokenExpiry: number = 0;
+  private tokenFailedAt: number = 0;
+  private tokenRequest: Promise<string> | null = null;
 
   constructor() {
     this.client = got.extend({
+      agent: httpAgent,
       prefixUrl: 'https://api.spotify.com/v1',
       headers: {
         'User-Agent': 'YouTubeMusicMCPServer/3.0.0',
@@ -66,7 +86,8 @@ export class SpotifyClient {
       retry: {
         limit: 3,
         methods: ['GET'],
-        statusCodes: [429, 500, 502, 503, 504],
+        statusCodes: TRANSIENT_STATUS_CODES,
+        calculateDelay: jitteredRetryDelay,
       },
     });
   }
@@ -81,20 +102,41 @@ export class SpotifyClient {
       return this.accessToken;
     }
 
+    if (Date.now() - this.tokenFailedAt < TOKEN_FAILURE_BACKOFF_MS) {
+      throw new Error('Failed to authenticate with Spotify API');
+    }
+
+    // Batch lookups fan out concurrently; let them all wait on one token
+    // request instead of each hitting the token endpoint when it expires
+    if (!this.tokenRequest) {
+      this.tokenRequest = this.requestAccessToken().finally(() => {
+        this.tokenRequest = null;
+      });
+    }
+    return this.tokenRequest;
+  }
+
+  /**
+   * Request a fresh access token from the Spotify accounts service
+   */
+  private async requestAccessToken(): Promise<string> {
     logger.debug('Requesting new Spotify access token');
 
     try {
-      const authString = Buffer.from(
-        `${config.spotifyClientId}:${config.spotifyClientSecret}`
-      ).toString('base64');
-
-      const response = await got.post('https://accounts.spotify.com/api/token', {
-        headers: {
-          Authorization: `Basic ${authString}`,
-          'Content-Type': 'application/x-www-form-urlencoded',
-        },
-        body: 'grant_type=client_credentials',
+      const response = await got.post(SPOTIFY_TOKEN_URL, {
+        agent: httpAgent,
+        headers: SPOTIFY_TOKEN_HEADERS,
+        body: SPOTIFY_TOKEN_BODY,
         responseType: 'json',
+        // got never retries POST by default, but re-requesting a
+        // client-credentials token is safe, so ride out transient failures
+        // here before falling back to the failure backoff
+        retry: {
+          limit: 3,
+          methods: ['POST'],
+          statusCodes: TRANSIENT_STATUS_CODES,
+          calculateDelay: jitteredRetryDelay,
+        },
       });
 
       const data = response.body as {
@@ -113,6 +155,7 @@ export class SpotifyClient {
 
       return this.accessToken;
     } catch (error) {
+      this.tokenFailedAt = Date.now();
       logger.error('Failed to get Spotify access token', { error });
       throw new Error('Failed to authenticate with Spotify API');
     }
@@ -248,10 +291,13 @@ export class SpotifyClient {
         allFeatures.push(...(data.audio_features || []));
       }
 
-      logger.debug('Retrieved multiple Spotify audio features', {
-        requested: trackIds.length,
-        received: allFeatures.filter((f) => f !== null).length,
-      });
+      // Counting hits walks every result, so only do it when debug is on
+      if (logger.isDebugEnabled()) {
+        logger.debug('Retrieved multiple Spotify audio features', {
+          requested: trackIds.length,
+          received: allFeatures.filter((f) => f !== null).length,
+        });
+      }
 
       return allFeatures;
     } catch (error) {
@@ -269,6 +315,7 @@ export class SpotifyClient {
   async close(): Promise<void> {
     this.accessToken = null;
     this.tokenExpiry = 0;
+    this.tokenFailedAt = 0;
     logger.info('Spotify client closed');
   }
 }
@@ -9,6 +9,25 @@ import type { Profile, Context } from '../adaptive-playlist/types.js';
 
 const logger = createLogger('adaptive-playlist-tools');
 
+const PROFILE_CODE_PATTERN = /🧬:([1-9A-Z]-[0-9A-ZX]{35})/;
+
+// Conversation script for generateNextQuestion, by phase
+const OPENING_QUESTIONS: readonly string[] = [
+  "What have you been listening to lately? Any artists on repeat?",
+  "What's the vibe you're going for - working out, relaxing, focusing, or something else?",
+  "Are you more in the mood for familiar favorites or discovering something new?",
+];
+const MIDDLE_QUESTIONS: readonly string[] = [
+  "How are you feeling right now? Energized, calm, happy, stressed?",
+  "Do you want music that matches your current mood or something to shift it?",
+  "Any specific genres or sounds you're drawn to these days?",
+];
+const REFINEMENT_QUESTIONS: readonly string[] = [
+  "Are lyrics important to you, or is it more about the sound and feel?",
+  "What decade or era of music resonates with you most?",
+  "Do you prefer mainstream hits or more underground/niche tracks?",
+];
+
 /**
  * Register adaptive playlist tools for AI-guided playlist creation
  */
@@ -64,17 +83,13 @@ export function registerAdaptivePlaylistTools(
           content: [
             {
               type: 'text',
-              text: JSON.stringify(
-                {
-                  sessionId: session.sessionId,
-                  message: session.conversationHistory[0]?.message || 'Hello! Let\'s build your perfect playlist.',
-                  questionsAsked: session.questionsAsked,
-                  confidence: session.confidence,
-                  readyForPlaylist: false,
-                },
-                null,
-                2
-              ),
+              text: JSON.stringify({
+                sessionId: session.sessionId,
+                message: session.conversationHistory[0]?.message || 'Hello! Let\'s build your perfect playlist.',
+                questionsAsked: session.questionsAsked,
+                confidence: session.confidence,
+                readyForPlaylist: false,
+              }),
             },
           ],
         };
@@ -148,18 +163,14 @@ export function registerAdaptivePlaylistTools(
           content: [
             {
               type: 'text',
-              text: JSON.stringify(
-                {
-                  sessionId: updated.sessionId,
-                  message: aiResponse,
-                  questionsAsked: updated.questionsAsked,
-                  confidence: updated.confidence,
-                  readyForPlaylist,
-                  currentProfile: updated.profile,
-                },
-                null,
-                2
-              ),
+              text: JSON.stringify({
+                sessionId: updated.sessionId,
+                message: aiResponse,
+                questionsAsked: updated.questionsAsked,
+                confidence: updated.confidence,
+                readyForPlaylist,
+                currentProfile: updated.profile,
+              }),
             },
           ],
         };
@@ -323,7 +334,8 @@ export function registerAdaptivePlaylistTools(
 
           playlistId = await context.ytMusic.createPlaylist(playlistName, description, 'PRIVATE');
 
-          const videoIds = recommendations.map((r) => r.track.videoId);
+          // The same track can surface from several recommendation sources
+          const videoIds = [...new Set(recommendations.map((r) => r.track.videoId))];
           await context.ytMusic.addPlaylistItems(playlistId, videoIds);
 
           logger.info('Playlist created on YouTube Music', { playlistId, trackCount: videoIds.length });
@@ -338,24 +350,20 @@ export function registerAdaptivePlaylistTools(
           content: [
             {
               type: 'text',
-              text: JSON.stringify(
-                {
-                  success: true,
-                  profileCode: encodedProfile,
-                  playlistId,
-                  trackCount: recommendations.length,
-                  avgScore: recommendations.reduce((sum, r) => sum + r.score, 0) / recommendations.length,
-                  tracks: recommendations.map((r) => ({
-                    videoId: r.track.videoId,
-                    title: r.track.title,
-                    artist: r.track.artist,
-                    score: r.score,
-                    breakdown: r.breakdown,
-                  })),
-                },
-                null,
-                2
-              ),
+              text: JSON.stringify({
+                success: true,
+                profileCode: encodedProfile,
+                playlistId,
+                trackCount: recommendations.length,
+                avgScore: recommendations.reduce((sum, r) => sum + r.score, 0) / recommendations.length,
+                tracks: recommendations.map((r) => ({
+                  videoId: r.track.videoId,
+                  title: r.track.title,
+                  artist: r.track.artist,
+                  score: r.score,
+                  breakdown: r.breakdown,
+                })),
+              }),
             },
           ],
         };
@@ -399,7 +407,7 @@ export function registerAdaptivePlaylistTools(
           content: [
             {
               type: 'text',
-              text: JSON.stringify(profile, null, 2),
+              text: JSON.stringify(profile),
             },
           ],
         };
@@ -442,7 +450,7 @@ export function registerAdaptivePlaylistTools(
         const description = (playlist as { description?: string }).description || '';
 
         // Extract profile code from description
-        const codeMatch = description.match(/🧬:([1-9A-Z]-[0-9A-ZX]{35})/);
+        const codeMatch = description.match(PROFILE_CODE_PATTERN);
         if (!codeMatch) {
           return {
             content: [
@@ -462,14 +470,10 @@ export function registerAdaptivePlaylistTools(
           content: [
             {
               type: 'text',
-              text: JSON.stringify(
-                {
-                  profileCode,
-                  profile,
-                },
-                null,
-                2
-              ),
+              text: JSON.stringify({
+                profileCode,
+                profile,
+              }),
             },
           ],
         };
@@ -500,22 +504,12 @@ function generateNextQuestion(
 
   // Opening questions (0-2): Focus on familiarity and activity
   if (questions < 3) {
-    const openingQuestions = [
-      "What have you been listening to lately? Any artists on repeat?",
-      "What's the vibe you're going for - working out, relaxing, focusing, or something else?",
-      "Are you more in the mood for familiar favorites or discovering something new?",
-    ];
-    return openingQuestions[questions] || openingQuestions[openingQuestions.length - 1] || 'Tell me about your music taste!';
+    return OPENING_QUESTIONS[questions] || OPENING_QUESTIONS[OPENING_QUESTIONS.length - 1] || 'Tell me about your music taste!';
   }
 
   // Middle questions (3-5): Context and mood
   if (questions < 6) {
-    const middleQuestions = [
-      "How are you feeling right now? Energized, calm, happy, stressed?",
-      "Do you want music that matches your current mood or something to shift it?",
-      "Any specific genres or sounds you're drawn to these days?",
-    ];
-    return middleQuestions[questions - 3] || middleQuestions[middleQuestions.length - 1] || 'How are you feeling?';
+    return MIDDLE_QUESTIONS[questions - 3] || MIDDLE_QUESTIONS[MIDDLE_QUESTIONS.length - 1] || 'How are you feeling?';
   }
 
   // Ready for generation
@@ -524,11 +518,5 @@ function generateNextQuestion(
   }
 
   // Additional refinement questions
-  const refinementQuestions = [
-    "Are lyrics important to you, or is it more about the sound and feel?",
-    "What decade or era of music resonates with you most?",
-    "Do you prefer mainstream hits or more underground/niche tracks?",
-  ];
-
-  return refinementQuestions[(questions - 6) % refinementQuestions.length] || 'Tell me more about what you like!';
+  return REFINEMENT_QUESTIONS[(questions - 6) % REFINEMENT_QUESTIONS.length] || 'Tell me more about what you like!';
 }
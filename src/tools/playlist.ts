@@ -2,7 +2,7 @@ import { McpServer } from '@modelcontextprotocol/sdk/server/mcp.js';
 import { z } from 'zod';
 import type { ServerContext } from '../server.js';
 import { createLogger } from '../utils/logger.js';
-import { sessionCache } from '../utils/session-cache.js';
+import { sessionCache, withCachedFlag } from '../utils/session-cache.js';
 
 const logger = createLogger('playlist-tools');
 
@@ -32,22 +32,24 @@ export function registerPlaylistTools(server: McpServer, context: ServerContext)
       const refresh = force_refresh ?? false;
       const CACHE_KEY = 'playlists';
 
-      logger.debug('get_playlists called', { effectiveLimit, refresh, cached: sessionCache.has(CACHE_KEY) });
+      // One lookup serves both the log line and the cache check, so the
+      // scoped key is only built once per call
+      const cached = sessionCache.get<string>(CACHE_KEY);
+      logger.debug('get_playlists called', { effectiveLimit, refresh, cached: cached !== undefined });
 
       try {
-        if (!refresh && sessionCache.has(CACHE_KEY)) {
-          const cached = sessionCache.get<{ playlists: unknown[]; metadata: unknown }>(CACHE_KEY)!;
+        if (!refresh && cached !== undefined) {
           logger.debug('get_playlists: returning cached result');
           return {
             content: [{
               type: 'text',
-              text: JSON.stringify({ ...cached, cached: true }, null, 2),
+              text: withCachedFlag(cached, true),
             }],
           };
         }
 
         const playlists = await context.ytData.getPlaylists(effectiveLimit);
-        const result = {
+        const json = JSON.stringify({
           playlists: playlists.map(p => ({
             id: p.id,
             name: p.title,
@@ -56,13 +58,13 @@ export function registerPlaylistTools(server: McpServer, context: ServerContext)
             trackCount: p.videoCount,
           })),
           metadata: { returned: playlists.length, limit: effectiveLimit },
-        };
-        sessionCache.set(CACHE_KEY, result);
+        });
+        sessionCache.set(CACHE_KEY, json);
 
         return {
           content: [{
             type: 'text',
-            text: JSON.stringify({ ...result, cached: false }, null, 2),
+            text: withCachedFlag(json, false),
           }],
         };
       } catch (error) {
@@ -116,7 +118,7 @@ export function registerPlaylistTools(server: McpServer, context: ServerContext)
                   limit: fetch_all ? 'all' : limit,
                   fetchedAll: fetch_all,
                 },
-              }, null, 2),
+              }),
             },
           ],
         };
@@ -172,7 +174,7 @@ export function registerPlaylistTools(server: McpServer, context: ServerContext)
                 success: true,
                 playlistId,
                 message: `Playlist "${name}" created successfully`,
-              }, null, 2),
+              }),
             },
           ],
         };
@@ -230,7 +232,7 @@ export function registerPlaylistTools(server: McpServer, context: ServerContext)
                 success: true,
                 playlistId: playlist_id,
                 message: 'Playlist updated successfully',
-              }, null, 2),
+              }),
             },
           ],
         };
@@ -279,7 +281,7 @@ export function registerPlaylistTools(server: McpServer, context: ServerContext)
               text: JSON.stringify({
                 success: true,
                 message: 'Playlist deleted successfully',
-              }, null, 2),
+              }),
             },
           ],
         };
@@ -323,7 +325,10 @@ export function registerPlaylistTools(server: McpServer, context: ServerContext)
       });
 
       try {
-        await context.ytData.addToPlaylist(playlist_id, video_ids);
+        // Each ID costs a separate insert request, so drop repeats up front
+        // (Set iteration keeps first-seen order)
+        const uniqueVideoIds = [...new Set(video_ids)];
+        await context.ytData.addToPlaylist(playlist_id, uniqueVideoIds);
 
         return {
           content: [
@@ -332,9 +337,9 @@ export function registerPlaylistTools(server: McpServer, context: ServerContext)
               text: JSON.stringify({
                 success: true,
                 playlistId: playlist_id,
-                addedCount: video_ids.length,
-                message: `Added ${video_ids.length} song(s) to playlist`,
-              }, null, 2),
+                addedCount: uniqueVideoIds.length,
+                message: `Added ${uniqueVideoIds.length} song(s) to playlist`,
+              }),
             },
           ],
         };
@@ -389,7 +394,7 @@ export function registerPlaylistTools(server: McpServer, context: ServerContext)
                 playlistId: playlist_id,
                 removedCount: set_video_ids.length,
                 message: `Removed ${set_video_ids.length} song(s) from playlist`,
-              }, null, 2),
+              }),
             },
           ],
         };
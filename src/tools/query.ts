@@ -2,10 +2,32 @@ import { McpServer } from '@modelcontextprotocol/sdk/server/mcp.js';
 import { z } from 'zod';
 import type { ServerContext } from '../server.js';
 import { createLogger } from '../utils/logger.js';
-import { sessionCache } from '../utils/session-cache.js';
+import { sessionCache, withCachedFlag } from '../utils/session-cache.js';
+import type { Thumbnail } from '../types/index.js';
 
 const logger = createLogger('query-tools');
 
+/**
+ * Keep only the smallest thumbnail on a search result.
+ * Every item carries each rendition YouTube Music returned, which dominates
+ * the serialized payload; the source objects are shared with the search
+ * cache, so a trimmed copy is returned instead of mutating them.
+ */
+function withSmallestThumbnail<T extends { thumbnails?: Thumbnail[] }>(item: T): T {
+  const thumbnails = item.thumbnails;
+  if (!thumbnails || thumbnails.length <= 1) {
+    return item;
+  }
+
+  let smallest = thumbnails[0] as Thumbnail;
+  for (const thumbnail of thumbnails) {
+    if (thumbnail.width < smallest.width) {
+      smallest = thumbnail;
+    }
+  }
+  return { ...item, thumbnails: [smallest] };
+}
+
 /**
  * Register query tools for searching and retrieving music data
  */
@@ -41,9 +63,9 @@ export function registerQueryTools(server: McpServer, context: ServerContext): v
             {
               type: 'text',
               text: JSON.stringify({
-                songs: result.songs ?? [],
+                songs: (result.songs ?? []).map(withSmallestThumbnail),
                 metadata: result.metadata,
-              }, null, 2),
+              }),
             },
           ],
         };
@@ -93,9 +115,9 @@ export function registerQueryTools(server: McpServer, context: ServerContext): v
             {
               type: 'text',
               text: JSON.stringify({
-                albums: result.albums ?? [],
+                albums: (result.albums ?? []).map(withSmallestThumbnail),
                 metadata: result.metadata,
-              }, null, 2),
+              }),
             },
           ],
         };
@@ -145,9 +167,9 @@ export function registerQueryTools(server: McpServer, context: ServerContext): v
             {
               type: 'text',
               text: JSON.stringify({
-                artists: result.artists ?? [],
+                artists: (result.artists ?? []).map(withSmallestThumbnail),
                 metadata: result.metadata,
-              }, null, 2),
+              }),
             },
           ],
         };
@@ -192,7 +214,7 @@ export function registerQueryTools(server: McpServer, context: ServerContext): v
           content: [
             {
               type: 'text',
-              text: JSON.stringify({ song }, null, 2),
+              text: JSON.stringify({ song }),
             },
           ],
         };
@@ -237,7 +259,7 @@ export function registerQueryTools(server: McpServer, context: ServerContext): v
           content: [
             {
               type: 'text',
-              text: JSON.stringify({ album }, null, 2),
+              text: JSON.stringify({ album }),
             },
           ],
         };
@@ -282,7 +304,7 @@ export function registerQueryTools(server: McpServer, context: ServerContext): v
           content: [
             {
               type: 'text',
-              text: JSON.stringify({ artist }, null, 2),
+              text: JSON.stringify({ artist }),
             },
           ],
         };
@@ -323,28 +345,30 @@ export function registerQueryTools(server: McpServer, context: ServerContext): v
       const refresh = force_refresh ?? false;
       const CACHE_KEY = 'library_songs';
 
-      logger.debug('get_library_songs called', { effectiveLimit, refresh, cached: sessionCache.has(CACHE_KEY) });
+      // One lookup serves both the log line and the cache check, so the
+      // scoped key is only built once per call
+      const cached = sessionCache.get<string>(CACHE_KEY);
+      logger.debug('get_library_songs called', { effectiveLimit, refresh, cached: cached !== undefined });
 
       try {
-        if (!refresh && sessionCache.has(CACHE_KEY)) {
-          const cached = sessionCache.get<{ songs: unknown[]; metadata: unknown }>(CACHE_KEY)!;
+        if (!refresh && cached !== undefined) {
           logger.debug('get_library_songs: returning cached result');
           return {
             content: [{
               type: 'text',
-              text: JSON.stringify({ ...cached, cached: true }, null, 2),
+              text: withCachedFlag(cached, true),
             }],
           };
         }
 
         const songs = await context.ytData.getLikedVideos(effectiveLimit);
-        const result = { songs, metadata: { returned: songs.length, limit: effectiveLimit } };
-        sessionCache.set(CACHE_KEY, result);
+        const json = JSON.stringify({ songs, metadata: { returned: songs.length, limit: effectiveLimit } });
+        sessionCache.set(CACHE_KEY, json);
 
         return {
           content: [{
             type: 'text',
-            text: JSON.stringify({ ...result, cached: false }, null, 2),
+            text: withCachedFlag(json, false),
           }],
         };
       } catch (error) {
@@ -0,0 +1,10 @@
+import { createHash } from 'crypto';
+
+/**
+ * Hash a token for use as a cache key, so plaintext tokens never become keys.
+ * OAuth tokens are ASCII, so their bytes are hashed as-is (latin1) rather
+ * than being run through the UTF-8 encoder first.
+ */
+export function hashToken(token: string): string {
+  return createHash('sha256').update(token, 'latin1').digest('base64url');
+}
@@ -0,0 +1,23 @@
+import http from 'node:http';
+import https from 'node:https';
+
+// Limits are per origin. Sized so concurrent tool calls from many HTTP
+// sessions share one warm pool per API host instead of queueing on it.
+const AGENT_OPTIONS: http.AgentOptions = {
+  keepAlive: true,
+  keepAliveMsecs: 1000,
+  maxSockets: 64,
+  maxFreeSockets: 32,
+  // Reuse the most recently used socket first, which is the one least
+  // likely to have been closed by the server while idle
+  scheduling: 'lifo',
+};
+
+/**
+ * Shared keep-alive agents for all outbound API clients.
+ * Reusing sockets avoids a fresh TCP + TLS handshake on every request.
+ */
+export const httpAgent = {
+  http: new http.Agent(AGENT_OPTIONS),
+  https: new https.Agent(AGENT_OPTIONS),
+};
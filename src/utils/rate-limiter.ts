@@ -1,3 +1,4 @@
+import { performance } from 'node:perf_hooks';
 import { createLogger } from './logger.js';
 
 const logger = createLogger('rate-limiter');
@@ -8,15 +9,23 @@ interface RateLimiterOptions {
   burstLimit?: number;
 }
 
-interface RequestRecord {
-  timestamp: number;
-}
+// Once this many expired slots pile up at the front of the log, compact it
+const COMPACT_THRESHOLD = 1024;
+
+// How long to back off when each limit is hit
+const BURST_WAIT_MS = 1000; // Wait 1 second
+const MINUTE_WAIT_MS = 5000; // Wait 5 seconds
+const HOUR_WAIT_MS = 60000; // Wait 1 minute
 
 export class RateLimiter {
   private readonly requestsPerMinute: number;
   private readonly requestsPerHour: number;
   private readonly burstLimit: number;
-  private readonly requests: RequestRecord[] = [];
+  // Request timestamps in ascending order, from the monotonic clock: limits
+  // only compare intervals, and wall-clock adjustments must not open or stall
+  // a window. Entries before `head` have aged out of the hour window.
+  private readonly timestamps: number[] = [];
+  private head = 0;
   private readonly name: string;
 
   constructor(name: string, options: RateLimiterOptions) {
@@ -30,14 +39,14 @@ export class RateLimiter {
    * Check if a request can be made, throws if rate limited
    */
   async acquire(): Promise<void> {
-    const now = Date.now();
+    const now = performance.now();
     this.cleanup(now);
 
     // Check burst limit (last 10 seconds)
     const burstWindow = now - 10000;
-    const burstCount = this.requests.filter(r => r.timestamp > burstWindow).length;
+    const burstCount = this.countSince(burstWindow);
     if (burstCount >= this.burstLimit) {
-      const waitTime = this.calculateWaitTime('burst');
+      const waitTime = BURST_WAIT_MS;
       logger.warn(`Rate limit exceeded (burst)`, {
         name: this.name,
         burstCount,
@@ -48,9 +57,9 @@ export class RateLimiter {
 
     // Check per-minute limit
     const minuteWindow = now - 60000;
-    const minuteCount = this.requests.filter(r => r.timestamp > minuteWindow).length;
+    const minuteCount = this.countSince(minuteWindow);
     if (minuteCount >= this.requestsPerMinute) {
-      const waitTime = this.calculateWaitTime('minute');
+      const waitTime = MINUTE_WAIT_MS;
       logger.warn(`Rate limit exceeded (per-minute)`, {
         name: this.name,
         minuteCount,
@@ -61,9 +70,9 @@ export class RateLimiter {
 
     // Check per-hour limit
     const hourWindow = now - 3600000;
-    const hourCount = this.requests.filter(r => r.timestamp > hourWindow).length;
+    const hourCount = this.countSince(hourWindow);
     if (hourCount >= this.requestsPerHour) {
-      const waitTime = this.calculateWaitTime('hour');
+      const waitTime = HOUR_WAIT_MS;
       logger.warn(`Rate limit exceeded (per-hour)`, {
         name: this.name,
         hourCount,
@@ -73,19 +82,19 @@ export class RateLimiter {
     }
 
     // Record the request
-    this.requests.push({ timestamp: Date.now() });
+    this.timestamps.push(performance.now());
   }
 
   /**
    * Get current usage statistics
    */
   getStats() {
-    const now = Date.now();
+    const now = performance.now();
     this.cleanup(now);
 
     return {
-      lastMinute: this.requests.filter(r => r.timestamp > now - 60000).length,
-      lastHour: this.requests.filter(r => r.timestamp > now - 3600000).length,
+      lastMinute: this.countSince(now - 60000),
+      lastHour: this.countSince(now - 3600000),
       limits: {
         perMinute: this.requestsPerMinute,
         perHour: this.requestsPerHour,
@@ -95,22 +104,34 @@ export class RateLimiter {
   }
 
   private cleanup(now: number) {
-    // Remove requests older than 1 hour
+    // Skip past requests older than 1 hour instead of shifting them off one
+    // by one, and only pay for a compaction once enough have accumulated
     const cutoff = now - 3600000;
-    while (this.requests.length > 0 && (this.requests[0]?.timestamp ?? 0) < cutoff) {
-      this.requests.shift();
+    while (this.head < this.timestamps.length && (this.timestamps[this.head] ?? 0) < cutoff) {
+      this.head++;
+    }
+    if (this.head >= COMPACT_THRESHOLD) {
+      this.timestamps.splice(0, this.head);
+      this.head = 0;
     }
   }
 
-  private calculateWaitTime(type: 'burst' | 'minute' | 'hour'): number {
-    switch (type) {
-      case 'burst':
-        return 1000; // Wait 1 second
-      case 'minute':
-        return 5000; // Wait 5 seconds
-      case 'hour':
-        return 60000; // Wait 1 minute
+  /**
+   * Count recorded requests newer than `since`
+   * Timestamps are ascending, so binary search for the first one in the window
+   */
+  private countSince(since: number): number {
+    let low = this.head;
+    let high = this.timestamps.length;
+    while (low < high) {
+      const mid = (low + high) >>> 1;
+      if ((this.timestamps[mid] ?? 0) > since) {
+        high = mid;
+      } else {
+        low = mid + 1;
+      }
     }
+    return this.timestamps.length - low;
   }
 
   private wait(ms: number): Promise<void> {
@@ -122,7 +143,8 @@ export class RateLimiter {
  * Fixed-interval rate limiter for APIs with strict limits (e.g., MusicBrainz)
  */
 export class FixedIntervalRateLimiter {
-  private lastRequest: number = 0;
+  // The monotonic clock starts near zero, so 0 would delay the first request
+  private lastRequest: number = Number.NEGATIVE_INFINITY;
   private readonly intervalMs: number;
   private readonly name: string;
 
@@ -132,7 +154,7 @@ export class FixedIntervalRateLimiter {
   }
 
   async acquire(): Promise<void> {
-    const now = Date.now();
+    const now = performance.now();
     const timeSinceLastRequest = now - this.lastRequest;
 
     if (timeSinceLastRequest < this.intervalMs) {
@@ -144,6 +166,6 @@ export class FixedIntervalRateLimiter {
       await new Promise(resolve => setTimeout(resolve, waitTime));
     }
 
-    this.lastRequest = Date.now();
+    this.lastRequest = performance.now();
   }
 }
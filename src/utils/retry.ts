@@ -0,0 +1,18 @@
+import type { RetryObject } from 'got';
+
+// Upstream responses worth retrying: rate limiting and transient server errors
+export const TRANSIENT_STATUS_CODES = [429, 500, 502, 503, 504];
+
+/**
+ * Retry delay for got's `retry.calculateDelay` with jitter.
+ * got's computed value already applies exponential backoff and honors
+ * Retry-After; adding up to half again on top spreads out retries from
+ * clients that failed together, without ever retrying sooner than asked.
+ */
+export function jitteredRetryDelay({ computedValue }: RetryObject): number {
+  // 0 means got decided not to retry
+  if (computedValue === 0) {
+    return 0;
+  }
+  return computedValue + Math.random() * computedValue * 0.5;
+}
@@ -1,25 +1,55 @@
+import { LRUCache } from 'lru-cache';
+import { tokenStore } from '../auth/token-store.js';
+import { hashToken } from './hash.js';
+
+// Upper bound on cached entries across all sessions (a handful per session)
+const MAX_CACHE_ENTRIES = 256;
+
 /**
  * In-memory session cache.
  * Lives for the lifetime of the stdio process (one Claude Desktop session).
  * Entries never expire automatically — only invalidated via force_refresh.
+ * Keys are scoped to the caller's credentials so HTTP users never see each
+ * other's library, and the total entry count is LRU-bounded.
  */
 class SessionCache {
-  private cache = new Map<string, unknown>();
+  private cache = new LRUCache<string, NonNullable<unknown>>({ max: MAX_CACHE_ENTRIES });
+  private lastToken: string | null = null;
+  // Key prefix for lastToken, including the separator, so scoping a key is
+  // a single concatenation
+  private lastTokenPrefix = '';
+
+  /**
+   * Scope keys by a hash of the access token rather than the MCP session ID.
+   * A client that reconnects with the same credentials gets a new session ID
+   * but should still hit its cached library; a refreshed token starts fresh.
+   */
+  private scoped(key: string): string {
+    const accessToken = tokenStore.getCurrentToken()?.accessToken;
+    if (!accessToken) {
+      return `${tokenStore.getCurrentSessionId() ?? 'default'}:${key}`;
+    }
+    if (accessToken !== this.lastToken) {
+      this.lastToken = accessToken;
+      this.lastTokenPrefix = `${hashToken(accessToken)}:`;
+    }
+    return this.lastTokenPrefix + key;
+  }
 
-  set(key: string, value: unknown): void {
-    this.cache.set(key, value);
+  set(key: string, value: NonNullable<unknown>): void {
+    this.cache.set(this.scoped(key), value);
   }
 
   get<T>(key: string): T | undefined {
-    return this.cache.get(key) as T | undefined;
+    return this.cache.get(this.scoped(key)) as T | undefined;
   }
 
   has(key: string): boolean {
-    return this.cache.has(key);
+    return this.cache.has(this.scoped(key));
   }
 
   invalidate(key: string): void {
-    this.cache.delete(key);
+    this.cache.delete(this.scoped(key));
   }
 
   clear(): void {
@@ -28,3 +58,12 @@ class SessionCache {
 }
 
 export const sessionCache = new SessionCache();
+
+/**
+ * Append a `cached` flag to an already-serialized JSON object.
+ * Lets large cached results be stored as JSON once instead of being
+ * re-serialized on every cache hit.
+ */
+export function withCachedFlag(json: string, cached: boolean): string {
+  return `${json.slice(0, -1)},"cached":${cached}}`;
+}
@@ -1,12 +1,28 @@
 import got, { Got } from 'got';
 import { createLogger } from '../utils/logger.js';
+import { httpAgent } from '../utils/http-agent.js';
 import { tokenStore } from '../auth/token-store.js';
+import { mapWithConcurrency } from '../utils/concurrency.js';
 import type { YouTubeMusicClient } from '../youtube-music/client.js';
 
 const logger = createLogger('youtube-data-api');
 
 // YouTube Data API v3 constants
 const YT_DATA_API_BASE = 'https://www.googleapis.com/youtube/v3';
+// Max concurrent YouTube Music lookups when enriching playlist items
+const YTM_ENRICH_CONCURRENCY = 4;
+// Max concurrent Data API `videos` batches when fetching durations; they all
+// draw on the same user's quota
+const DURATION_BATCH_CONCURRENCY = 4;
+const ISO_DURATION_PATTERN = /PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?/;
+
+// Partial-response field masks: large listings otherwise ship thumbnails,
+// descriptions and etags we never read, all buffered and parsed per page
+const PLAYLISTS_FIELDS =
+  'nextPageToken,items(id,snippet(title,description),status/privacyStatus,contentDetails/itemCount)';
+const PLAYLIST_ITEMS_FIELDS =
+  'nextPageToken,items(id,snippet(title,position,channelTitle,videoOwnerChannelTitle),contentDetails/videoId)';
+const VIDEO_DURATION_FIELDS = 'items(id,contentDetails/duration)';
 
 export interface Playlist {
   id: string;
@@ -26,6 +42,7 @@ export class YouTubeDataClient {
 
   constructor(ytMusicClient?: YouTubeMusicClient) {
     this.client = got.extend({
+      agent: httpAgent,
       prefixUrl: YT_DATA_API_BASE,
       responseType: 'json',
       timeout: {
@@ -48,13 +65,21 @@ export class YouTubeDataClient {
   }
 
   /**
-   * Get user's playlists (with pagination support)
+   * Get OAuth access token, failing the call when there is none
    */
-  async getPlaylists(maxResults: number = 25): Promise<Playlist[]> {
+  private requireAccessToken(): string {
     const accessToken = this.getAccessToken();
     if (!accessToken) {
       throw new Error('No access token available');
     }
+    return accessToken;
+  }
+
+  /**
+   * Get user's playlists (with pagination support)
+   */
+  async getPlaylists(maxResults: number = 25): Promise<Playlist[]> {
+    const accessToken = this.requireAccessToken();
 
     try {
       const playlists: Playlist[] = [];
@@ -65,6 +90,7 @@ export class YouTubeDataClient {
         const response = await this.client.get('playlists', {
           searchParams: {
             part: 'snippet,contentDetails,status',
+            fields: PLAYLISTS_FIELDS,
             mine: 'true',
             maxResults: perPage,
             ...(pageToken && { pageToken }),
@@ -111,10 +137,7 @@ export class YouTubeDataClient {
     description: string = '',
     privacy: 'private' | 'public' | 'unlisted' = 'private'
   ): Promise<string> {
-    const accessToken = this.getAccessToken();
-    if (!accessToken) {
-      throw new Error('No access token available');
-    }
+    const accessToken = this.requireAccessToken();
 
     try {
       const response = await this.client.post('playlists', {
@@ -152,10 +175,7 @@ export class YouTubeDataClient {
    * Delete a playlist
    */
   async deletePlaylist(playlistId: string): Promise<void> {
-    const accessToken = this.getAccessToken();
-    if (!accessToken) {
-      throw new Error('No access token available');
-    }
+    const accessToken = this.requireAccessToken();
 
     try {
       await this.client.delete('playlists', {
@@ -187,10 +207,7 @@ export class YouTubeDataClient {
       privacy?: 'private' | 'public' | 'unlisted';
     }
   ): Promise<void> {
-    const accessToken = this.getAccessToken();
-    if (!accessToken) {
-      throw new Error('No access token available');
-    }
+    const accessToken = this.requireAccessToken();
 
     try {
       // eslint-disable-next-line @typescript-eslint/no-explicit-any
@@ -228,25 +245,25 @@ export class YouTubeDataClient {
    * Add videos to playlist
    */
   async addToPlaylist(playlistId: string, videoIds: string[]): Promise<void> {
-    const accessToken = this.getAccessToken();
-    if (!accessToken) {
-      throw new Error('No access token available');
-    }
+    const accessToken = this.requireAccessToken();
 
     const results: { videoId: string; success: boolean; error?: string }[] = [];
     let successCount = 0;
     let failureCount = 0;
 
+    // The Data API inserts one item per request, and inserts stay sequential
+    // so songs land in the order given; only the body varies per video
+    const searchParams = { part: 'snippet' };
+    const headers = {
+      Authorization: `Bearer ${accessToken}`,
+      'Content-Type': 'application/json',
+    };
+
     for (const videoId of videoIds) {
       try {
         await this.client.post('playlistItems', {
-          searchParams: {
-            part: 'snippet',
-          },
-          headers: {
-            Authorization: `Bearer ${accessToken}`,
-            'Content-Type': 'application/json',
-          },
+          searchParams,
+          headers,
           json: {
             snippet: {
               playlistId,
@@ -310,10 +327,9 @@ export class YouTubeDataClient {
    * Remove videos from playlist
    */
   async removeFromPlaylist(playlistItemIds: string[]): Promise<void> {
-    const accessToken = this.getAccessToken();
-    if (!accessToken) {
-      throw new Error('No access token available');
-    }
+    const accessToken = this.requireAccessToken();
+
+    const headers = { Authorization: `Bearer ${accessToken}` };
 
     try {
       for (const itemId of playlistItemIds) {
@@ -321,9 +337,7 @@ export class YouTubeDataClient {
           searchParams: {
             id: itemId,
           },
-          headers: {
-            Authorization: `Bearer ${accessToken}`,
-          },
+          headers,
         });
       }
 
@@ -343,10 +357,7 @@ export class YouTubeDataClient {
    */
   // eslint-disable-next-line @typescript-eslint/no-explicit-any
   async getPlaylistItems(playlistId: string, maxResults: number = 50): Promise<any[]> {
-    const accessToken = this.getAccessToken();
-    if (!accessToken) {
-      throw new Error('No access token available');
-    }
+    const accessToken = this.requireAccessToken();
 
     try {
       // eslint-disable-next-line @typescript-eslint/no-explicit-any
@@ -358,6 +369,7 @@ export class YouTubeDataClient {
         const response = await this.client.get('playlistItems', {
           searchParams: {
             part: 'snippet,contentDetails',
+            fields: PLAYLIST_ITEMS_FIELDS,
             playlistId,
             maxResults: perPage,
             ...(pageToken && { pageToken }),
@@ -376,7 +388,6 @@ export class YouTubeDataClient {
           title: item.snippet.title,
           artist: item.snippet.videoOwnerChannelTitle || item.snippet.channelTitle,
           position: item.snippet.position,
-          thumbnails: item.snippet.thumbnails || {},
         }));
 
         items.push(...pageItems);
@@ -396,9 +407,8 @@ export class YouTubeDataClient {
 
       return finalItems.map(item => {
         const enrichment = enrichedData.get(item.videoId);
-        const { thumbnails: _thumbnails, ...itemWithoutThumbnails } = item;
         return this.cleanObject({
-          ...itemWithoutThumbnails,
+          ...item,
           duration: enrichment ? this.formatDuration(enrichment.durationSeconds) : undefined,
           durationSeconds: enrichment?.durationSeconds,
           album: enrichment?.album,
@@ -426,17 +436,49 @@ export class YouTubeDataClient {
       return new Map();
     }
 
+    // Durations (YouTube Data API) and music metadata (YouTube Music API)
+    // come from independent endpoints, so fetch them concurrently
+    const [durations, musicData] = await Promise.all([
+      this.fetchDurations(videoIds, accessToken),
+      this.fetchMusicMetadata(videoIds),
+    ]);
+
     // eslint-disable-next-line @typescript-eslint/no-explicit-any
     const enrichedData = new Map<string, any>();
+    for (const videoId of videoIds) {
+      const durationSeconds = durations.get(videoId);
+      const music = musicData.get(videoId);
+      if (durationSeconds === undefined && !music) {
+        continue;
+      }
+      enrichedData.set(videoId, {
+        ...(durationSeconds !== undefined && { durationSeconds }),
+        ...music,
+      });
+    }
 
-    // First get duration from YouTube Data API in batches of 50
+    return enrichedData;
+  }
+
+  /**
+   * Get durations from YouTube Data API in batches of 50
+   */
+  private async fetchDurations(
+    videoIds: string[],
+    accessToken: string
+  ): Promise<Map<string, number | null>> {
+    const durations = new Map<string, number | null>();
+    const batches: string[][] = [];
     for (let i = 0; i < videoIds.length; i += 50) {
-      const batch = videoIds.slice(i, i + 50);
+      batches.push(videoIds.slice(i, i + 50));
+    }
 
+    await mapWithConcurrency(batches, DURATION_BATCH_CONCURRENCY, async (batch) => {
       try {
         const response = await this.client.get('videos', {
           searchParams: {
             part: 'contentDetails',
+            fields: VIDEO_DURATION_FIELDS,
             id: batch.join(','),
           },
           headers: {
@@ -448,49 +490,58 @@ export class YouTubeDataClient {
         const data = response.body as any;
         // eslint-disable-next-line @typescript-eslint/no-explicit-any
         (data.items || []).forEach((item: any) => {
-          enrichedData.set(item.id, {
-            durationSeconds: this.parseDuration(item.contentDetails?.duration),
-          });
+          durations.set(item.id, this.parseDuration(item.contentDetails?.duration));
         });
       } catch (error) {
         logger.warn('Failed to get duration data', { error, batchSize: batch.length });
       }
+    });
+
+    return durations;
+  }
+
+  /**
+   * Get album, artists, year and explicit flag from YouTube Music
+   * Note: YouTube Music API doesn't support batch requests, so songs are
+   * fetched individually with a bounded number in flight
+   */
+  // eslint-disable-next-line @typescript-eslint/no-explicit-any
+  private async fetchMusicMetadata(videoIds: string[]): Promise<Map<string, any>> {
+    // eslint-disable-next-line @typescript-eslint/no-explicit-any
+    const metadata = new Map<string, any>();
+    const ytMusicClient = this.ytMusicClient;
+    if (!ytMusicClient) {
+      return metadata;
     }
 
-    // Then enrich with YouTube Music metadata (album, artists, year, explicit)
-    // Note: YouTube Music API doesn't support batch requests, so we fetch individually
-    if (this.ytMusicClient) {
-      for (const videoId of videoIds) {
-        try {
-          const song = await this.ytMusicClient.getSong(videoId);
-          const existing = enrichedData.get(videoId) || {};
-
-          // Get explicit flag by searching (only if title and artist available)
-          let explicit: boolean | undefined;
-          if (song.title && song.artists && song.artists.length > 0 && song.artists[0]) {
-            const artistName = song.artists[0].name;
-            explicit = await this.ytMusicClient.getExplicitFlag(
-              videoId,
-              song.title,
-              artistName
-            );
-          }
-
-          enrichedData.set(videoId, {
-            ...existing,
-            album: song.album,
-            artists: song.artists,
-            year: song.year,
-            explicit,
-          });
-        } catch {
-          // YouTube Music API call failed, keep the data we have
-          logger.debug('Failed to get YouTube Music metadata', { videoId });
+    await mapWithConcurrency(videoIds, YTM_ENRICH_CONCURRENCY, async (videoId) => {
+      try {
+        const song = await ytMusicClient.getSong(videoId);
+
+        // Get explicit flag by searching (only if title and artist available)
+        let explicit: boolean | undefined;
+        if (song.title && song.artists && song.artists.length > 0 && song.artists[0]) {
+          const artistName = song.artists[0].name;
+          explicit = await ytMusicClient.getExplicitFlag(
+            videoId,
+            song.title,
+            artistName
+          );
         }
+
+        metadata.set(videoId, {
+          album: song.album,
+          artists: song.artists,
+          year: song.year,
+          explicit,
+        });
+      } catch {
+        // YouTube Music API call failed, keep the data we have
+        logger.debug('Failed to get YouTube Music metadata', { videoId });
       }
-    }
+    });
 
-    return enrichedData;
+    return metadata;
   }
 
   /**
@@ -509,7 +560,7 @@ export class YouTubeDataClient {
   private parseDuration(isoDuration: string | null): number | null {
     if (!isoDuration) return null;
 
-    const match = isoDuration.match(/PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?/);
+    const match = isoDuration.match(ISO_DURATION_PATTERN);
     if (!match) return null;
 
     const hours = parseInt(match[1] || '0');
@@ -541,10 +592,7 @@ export class YouTubeDataClient {
    */
   // eslint-disable-next-line @typescript-eslint/no-explicit-any
   async getLikedVideos(maxResults: number = 50): Promise<any[]> {
-    const accessToken = this.getAccessToken();
-    if (!accessToken) {
-      throw new Error('No access token available');
-    }
+    const accessToken = this.requireAccessToken();
 
     try {
       // eslint-disable-next-line @typescript-eslint/no-explicit-any
@@ -558,6 +606,7 @@ export class YouTubeDataClient {
         const response = await this.client.get('playlistItems', {
           searchParams: {
             part: 'snippet,contentDetails',
+            fields: PLAYLIST_ITEMS_FIELDS,
             playlistId: 'LM',
             maxResults: perPage,
             ...(pageToken && { pageToken }),
@@ -574,7 +623,6 @@ export class YouTubeDataClient {
           videoId: item.contentDetails.videoId,
           title: item.snippet.title,
           artist: item.snippet.videoOwnerChannelTitle || item.snippet.channelTitle,
-          thumbnails: item.snippet.thumbnails || {},
         }));
 
         songs.push(...pageItems);
@@ -594,9 +642,8 @@ export class YouTubeDataClient {
 
       return finalSongs.map(song => {
         const enrichment = enrichedData.get(song.videoId);
-        const { thumbnails: _thumbnails, ...songWithoutThumbnails } = song;
         return this.cleanObject({
-          ...songWithoutThumbnails,
+          ...song,
           duration: enrichment ? this.formatDuration(enrichment.durationSeconds) : undefined,
           durationSeconds: enrichment?.durationSeconds,
           album: enrichment?.album,
@@ -618,10 +665,7 @@ export class YouTubeDataClient {
    * Returns null if video doesn't have ISRC (user uploads, covers, etc.)
    */
   async getVideoISRC(videoId: string): Promise<string | null> {
-    const accessToken = this.getAccessToken();
-    if (!accessToken) {
-      throw new Error('No access token available');
-    }
+    const accessToken = this.requireAccessToken();
 
     try {
       logger.debug('Fetching ISRC for video', { videoId });
@@ -10,11 +10,19 @@ type YTMResponse = Record<string, unknown>;
 // Helper Functions
 // =============================================================================
 
+// Split accessor paths, keyed by the dotted path. Every caller passes a
+// string literal, so this stays bounded by the number of call sites.
+const PATH_SEGMENTS = new Map<string, readonly string[]>();
+
 /**
  * Safely navigate nested object properties
  */
 function getNestedValue(obj: unknown, path: string): unknown {
-  const keys = path.split('.');
+  let keys = PATH_SEGMENTS.get(path);
+  if (!keys) {
+    keys = path.split('.');
+    PATH_SEGMENTS.set(path, keys);
+  }
   let current: unknown = obj;
 
   for (const key of keys) {
@@ -179,12 +187,17 @@ export function parseSearchResults(
               'browseEndpointContextSupportedConfigs.browseEndpointContextMusicConfig.pageType'
             ) as string | undefined;
 
-            if (pageType === 'MUSIC_PAGE_TYPE_ALBUM') {
-              const album = parseAlbumFromSearchResult(musicData, browseId);
-              if (album) albums.push(album);
-            } else if (pageType === 'MUSIC_PAGE_TYPE_ARTIST') {
-              const artist = parseArtistFromSearchResult(musicData, browseId);
-              if (artist) artists.push(artist);
+            switch (pageType) {
+              case 'MUSIC_PAGE_TYPE_ALBUM': {
+                const album = parseAlbumFromSearchResult(musicData, browseId);
+                if (album) albums.push(album);
+                break;
+              }
+              case 'MUSIC_PAGE_TYPE_ARTIST': {
+                const artist = parseArtistFromSearchResult(musicData, browseId);
+                if (artist) artists.push(artist);
+                break;
+              }
             }
           }
         }
@@ -248,14 +261,17 @@ function parseSongFromSearchResult(data: YTMResponse, videoId: string): Song | n
           const pageType = browseEndpoint.browseEndpointContextSupportedConfigs
             ?.browseEndpointContextMusicConfig?.pageType;
 
-          if (pageType === 'MUSIC_PAGE_TYPE_ARTIST') {
-            artists.push({
-              id: browseEndpoint.browseId,
-              name: run.text ?? '',
-            });
-          } else if (pageType === 'MUSIC_PAGE_TYPE_ALBUM') {
-            albumName = run.text ?? '';
-            albumId = browseEndpoint.browseId ?? '';
+          switch (pageType) {
+            case 'MUSIC_PAGE_TYPE_ARTIST':
+              artists.push({
+                id: browseEndpoint.browseId,
+                name: run.text ?? '',
+              });
+              break;
+            case 'MUSIC_PAGE_TYPE_ALBUM':
+              albumName = run.text ?? '';
+              albumId = browseEndpoint.browseId ?? '';
+              break;
           }
         }
       }
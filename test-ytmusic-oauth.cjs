@@ -2,9 +2,11 @@ const https = require('https');
 
 // Test if we can use OAuth Bearer token with YouTube Music internal API
 const accessToken = process.argv[2];
+// Browse responses run to megabytes; only re-indent them when asked
+const pretty = process.argv.includes('--pretty');
 
 if (!accessToken) {
-  console.error('Usage: node test-ytmusic-oauth.cjs <access_token>');
+  console.error('Usage: node test-ytmusic-oauth.cjs <access_token> [--pretty]');
   process.exit(1);
 }
 
@@ -37,13 +39,18 @@ const req = https.request(options, (res) => {
   console.log(`Status: ${res.statusCode}`);
   console.log('Headers:', JSON.stringify(res.headers, null, 2));
 
-  let body = '';
+  const chunks = [];
   res.on('data', (chunk) => {
-    body += chunk;
+    chunks.push(chunk);
   });
 
   res.on('end', () => {
+    const body = Buffer.concat(chunks).toString('utf8');
     console.log('\nResponse:');
+    if (!pretty) {
+      console.log(body);
+      return;
+    }
     try {
       console.log(JSON.stringify(JSON.parse(body), null, 2));
     } catch (e) {